@@ -1,5 +1,6 @@
 import cProfile
 import enum
+import timeit
 from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
@@ -187,3 +188,12 @@ def bench():
 
 
 cProfile.run('''for i in range(25000): bench()''', sort='tottime')
+
+
+# GenConverter must not unstructure slower than Converter.
+for conv in (convclasses.Converter(), convclasses.GenConverter()):
+    conv.unstructure(obj)
+    t = min(timeit.repeat(lambda: conv.unstructure(obj), number=25000))
+    print("{}.unstructure: {:.1f}us".format(
+        conv.__class__.__name__, t / 25000 * 1e6
+    ))
@@ -38,7 +38,7 @@ setup(
     package_dir={"": "src"},
     include_package_data=True,
     install_requires=requirements,
-    extras_require={"dev": dev_reqs},
+    extras_require={"dev": dev_reqs, "numpy": ["numpy"]},
     license="MIT license",
     zip_safe=False,
     keywords="convclasses",
@@ -1,4 +1,9 @@
-from .converters import Converter, UnstructureStrategy
+from .converters import (
+    ColumnType,
+    Converter,
+    GenConverter,
+    UnstructureStrategy,
+)
 from .modifiers import mod
 
 __all__ = (
@@ -8,7 +13,9 @@ __all__ = (
     "structure_dataclass_fromtuple",
     "structure_dataclass_fromdict",
     "UnstructureStrategy",
+    "ColumnType",
     "Converter",
+    "GenConverter",
     "mod",
 )
 
@@ -161,3 +161,14 @@ else:
 
 def is_generic(obj):
     return isinstance(obj, _GenericAlias)
+
+
+try:
+    from typing import Literal
+except ImportError:  # pragma: no cover
+    # Python 3.7.
+    Literal = None
+
+
+def is_literal(type):
+    return Literal is not None and get_origin(type) is Literal
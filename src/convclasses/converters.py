@@ -1,12 +1,26 @@
+import gc
 import logging
-from dataclasses import fields, is_dataclass
+from array import array
+from collections import abc, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import MISSING, fields, is_dataclass
 from enum import Enum
+from itertools import islice, repeat
+from operator import attrgetter
 from typing import (  # noqa: F401, imported for Mypy.
+    AbstractSet,
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Callable,
     Dict,
     FrozenSet,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -16,10 +30,12 @@ from typing import (  # noqa: F401, imported for Mypy.
 )
 
 from ._compat import (
+    get_args,
     get_origin,
     is_bare,
     is_frozenset,
     is_generic,
+    is_literal,
     is_mapping,
     is_mutable_set,
     is_sequence,
@@ -27,10 +43,34 @@ from ._compat import (
     is_union_type,
     lru_cache,
 )
-from .disambiguators import create_uniq_field_dis_func
-from .gen import make_dict_structure_fn
+from .disambiguators import (
+    class_tags,
+    create_tag_dis_func,
+    create_type_dis_func,
+    create_uniq_field_dis_func,
+)
+from .function_dispatch import ALIAS, CLASS, UNION
+from .gen import (
+    _has_own_hook,
+    is_generating,
+    make_dict_structure_fn,
+    make_dict_unstructure_fn,
+    make_tuple_structure_fn,
+    make_tuple_unstructure_fn,
+)
+from .lazy import (
+    _CLASS_CACHE_SIZE,
+    DataclassView,
+    LazyMapping,
+    LazySequence,
+    make_lazy,
+    make_view,
+)
 from .modifiers import _Modificator
-from .multistrategy_dispatch import MultiStrategyDispatch
+from .multistrategy_dispatch import (  # noqa: F401, imported for Mypy.
+    DispatchCacheInfo,
+    MultiStrategyDispatch,
+)
 
 NoneType = type(None)
 T = TypeVar("T")
@@ -46,13 +86,145 @@ class UnstructureStrategy(Enum):
     AS_TUPLE = "astuple"
 
 
+class ColumnType(Enum):
+    """How ``Converter.unstructure_columns`` stores numeric columns."""
+
+    LIST = "list"
+    ARRAY = "array"
+    NUMPY = "numpy"
+
+
+# Fields of these types become ``array.array`` columns with these typecodes.
+_ARRAY_TYPECODES = {int: "q", float: "d"}
+
+
+class _FieldInfo(NamedTuple):
+    """What the interpreted unstructuring paths need to know about a
+    field."""
+
+    name: str
+    obj_name: str
+    type: Any
+    has_default: bool
+
+
+@lru_cache(maxsize=_CLASS_CACHE_SIZE)
+def _field_infos(cl):
+    # type: (Type) -> Tuple[_FieldInfo, ...]
+    """The field infos of a dataclass, which don't depend on any hooks."""
+    return tuple(
+        _FieldInfo(
+            a.name,
+            _Modificator(a).obj_name,
+            a.type,
+            a.default is not MISSING or a.default_factory is not MISSING,
+        )
+        for a in fields(cl)
+    )
+
+
+class _FieldPlan(NamedTuple):
+    """What the interpreted structuring paths need to know about a field."""
+
+    name: str
+    obj_name: str
+    type: Any
+    has_default: bool
+    # The structuring hook for ``type``; ``None`` if there is no type.
+    handler: Optional[Callable[[Any, Any], Any]]
+
+
+@contextmanager
+def _gc_paused(pause):
+    """Disable the cyclic garbage collector for the duration, if asked."""
+    if not pause or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
 def _subclass(typ):
     """ a shortcut """
     return lambda cls: issubclass(cls, typ)
 
 
+_CLS = (CLASS,)
+_ALIAS = (ALIAS,)
+_ALIAS_CLS = (ALIAS, CLASS)
+_UNION = (UNION,)
+
+
+def _rebuild_converter(cls, config):
+    """Recreate a pickled converter, without its hooks."""
+    return cls(**config)
+
+
+# The converter of a ``structure_parallel`` worker process.
+_worker_converter = None
+
+
+def _init_worker(converter, cl):
+    global _worker_converter
+    _worker_converter = converter
+    # Resolve, and compile, the hooks before the first chunk comes in.
+    converter._structure_func.dispatch(cl)
+
+
+def _structure_chunk(chunk, cl):
+    return _worker_converter.structure_many(chunk, cl)
+
+
+def _fitting(make, *args):
+    """Call ``make(*args)``, or return ``None`` if it overflows, as arrays
+    do with Python ints not fitting in 64 bits."""
+    try:
+        return make(*args)
+    except OverflowError:
+        return None
+
+
+def _is_numeric_abc_sequence(typ):
+    """Whether ``typ`` is like ``Sequence[int]`` or ``Sequence[float]``."""
+    return (
+        get_origin(typ) in (abc.Sequence, abc.MutableSequence)
+        and get_args(typ)[0] in _ARRAY_TYPECODES
+    )
+
+
+def _is_generic_dataclass(typ):
+    return is_generic(typ) and is_dataclass(get_origin(typ))
+
+
 class Converter(object):
-    """Converts between structured and unstructured data."""
+    """Converts between structured and unstructured data.
+
+    Hooks are looked up through caches of ``dispatch_cache_size`` types each,
+    and the functions generated for projections are cached in another such
+    cache. Use ``None`` for unbounded caches; those are a good fit when the
+    set of converted types is known and large.
+
+    With ``array_sequences``, ``Sequence[int]`` and ``Sequence[float]`` (and
+    their ``MutableSequence`` counterparts) are structured into
+    ``array.array`` instead of lists, unless the ints don't fit in 64 bits.
+
+    With ``trust_input``, structuring returns inputs which already are what
+    would be produced as is, instead of copies: primitives and enum members
+    of exactly the requested class, and lists, tuples, sets, frozensets and
+    dicts of exactly those (or of anything, for ``Any`` items). The result
+    may then share containers with the input.
+
+    With ``lazy_collection_threshold``, lists and dicts with at least that
+    many items are structured into read-only views, ``LazySequence`` and
+    ``LazyMapping``, which structure items when they're accessed. Items of
+    primitive types are always structured eagerly.
+
+    With ``collect_dispatch_stats``, the number of types each predicate hook
+    was chosen for is counted; see ``dispatch_stats``.
+    """
 
     __slots__ = (
         "_dis_func_cache",
@@ -62,10 +234,24 @@ class Converter(object):
         "_dict_factory",
         "_union_registry",
         "_structure_func",
+        "_field_plans",
+        "_projected_fns",
+        "_registrations",
+        "_array_sequences",
+        "_trust_input",
+        "_lazy_collection_threshold",
+        "_collect_dispatch_stats",
     )
 
     def __init__(
-        self, dict_factory=dict, unstruct_strat=UnstructureStrategy.AS_DICT
+        self,
+        dict_factory=dict,
+        unstruct_strat=UnstructureStrategy.AS_DICT,
+        dispatch_cache_size=64,
+        array_sequences=False,
+        trust_input=False,
+        lazy_collection_threshold=None,
+        collect_dispatch_stats=False,
     ):
         unstruct_strat = UnstructureStrategy(unstruct_strat)
 
@@ -80,38 +266,55 @@ class Converter(object):
         self._dis_func_cache = lru_cache()(self._get_dis_func)
 
         self._unstructure_func = MultiStrategyDispatch(
-            self._unstructure_identity
+            self._unstructure_identity,
+            dispatch_cache_size,
+            collect_dispatch_stats,
         )
         self._unstructure_func.register_cls_list(
             [
                 (bytes, self._unstructure_identity),
                 (str, self._unstructure_identity),
+                (LazySequence, self.unstructure_many),
+                (LazyMapping, self._unstructure_lazy_mapping),
+                (DataclassView, self._unstructure_view),
             ]
         )
+        # Unstructure hooks are always looked up by class.
         self._unstructure_func.register_func_list(
             [
-                (_subclass(Mapping), self._unstructure_mapping),
-                (_subclass(Sequence), self._unstructure_seq),
-                (_subclass(Set), self._unstructure_seq),
-                (_subclass(FrozenSet), self._unstructure_seq),
-                (_subclass(Enum), self._unstructure_enum),
-                (is_dataclass, self._unstructure_dataclass),
+                (_subclass(Mapping), self._unstructure_mapping, False, _CLS),
+                (_subclass(Sequence), self._unstructure_seq, False, _CLS),
+                (_subclass(Set), self._unstructure_seq, False, _CLS),
+                (_subclass(FrozenSet), self._unstructure_seq, False, _CLS),
+                (_subclass(Enum), self._unstructure_enum, False, _CLS),
+                (is_dataclass, self._unstructure_dataclass, False, _CLS),
             ]
         )
 
         # Per-instance register of to-dataclasses converters.
         # Singledispatch dispatches based on the first argument, so we
         # store the function and switch the arguments in self.loads.
-        self._structure_func = MultiStrategyDispatch(self._structure_default)
+        self._structure_func = MultiStrategyDispatch(
+            self._structure_default,
+            dispatch_cache_size,
+            collect_dispatch_stats,
+        )
         self._structure_func.register_func_list(
             [
-                (is_sequence, self._structure_list),
-                (is_mutable_set, self._structure_set),
-                (is_frozenset, self._structure_frozenset),
-                (is_tuple, self._structure_tuple),
-                (is_mapping, self._structure_dict),
-                (is_union_type, self._structure_union),
-                (is_dataclass, self._structure_dataclass),
+                (is_sequence, self._structure_list, False, _ALIAS_CLS),
+                (is_mutable_set, self._structure_set, False, _ALIAS_CLS),
+                (is_frozenset, self._structure_frozenset, False, _ALIAS_CLS),
+                (is_tuple, self._structure_tuple, False, _ALIAS_CLS),
+                (is_mapping, self._structure_dict, False, _ALIAS_CLS),
+                (is_union_type, self._gen_structure_union, True, _UNION),
+                (is_literal, self._structure_literal, False, _ALIAS),
+                (is_dataclass, self._structure_dataclass, False, _CLS),
+                (
+                    _is_generic_dataclass,
+                    self._gen_structure_generic_dataclass,
+                    True,
+                    _ALIAS,
+                ),
             ]
         )
         # Strings are sequences.
@@ -124,17 +327,127 @@ class Converter(object):
                 (Enum, self._structure_call),
             ]
         )
+        self._array_sequences = array_sequences
+        if array_sequences:
+            self._structure_func.register_func_list(
+                [
+                    (
+                        _is_numeric_abc_sequence,
+                        self._structure_array,
+                        False,
+                        _ALIAS,
+                    )
+                ]
+            )
+        self._trust_input = trust_input
+        if trust_input:
+            self._structure_func.register_cls_list(
+                [
+                    (str, self._structure_passthrough),
+                    (bytes, self._structure_passthrough),
+                    (int, self._structure_passthrough),
+                    (float, self._structure_passthrough),
+                    (Enum, self._structure_passthrough),
+                ]
+            )
+
+        self._lazy_collection_threshold = lazy_collection_threshold
+        self._collect_dispatch_stats = collect_dispatch_stats
 
         self._dict_factory = dict_factory
 
         # Unions are instances now, not classes. We use different registry.
         self._union_registry = {}
 
-    def unstructure(self, obj):
-        # type: (Any) -> Any
+        # Field plans of dataclasses, built on first use and cached like
+        # hooks. Plans contain structuring hooks, so they're dropped when
+        # those change.
+        self._reset_field_plans()
+
+        # Functions generated per (direction, class, projection), dropped
+        # when any hook changes. Projections may come from clients, so they
+        # are cached like hooks, in a cache of ``dispatch_cache_size``.
+        self._reset_projected_fns()
+
+        # Hooks registered through the public methods, as (method name,
+        # arguments) pairs, replayed when unpickling. Hooks for a class or
+        # union replace the ones registered for it before, so they are keyed
+        # by it; the others are kept in order.
+        self._registrations = {}
+
+    def __reduce__(self):
+        """Pickle the converter as its configuration and registered hooks.
+
+        The hooks, and the predicates and factories they were registered
+        with, have to be picklable themselves. They are pickled as the
+        state of the converter, so they may be its own bound methods.
+        """
+        return (
+            _rebuild_converter,
+            (self.__class__, self._config()),
+            {"registrations": tuple(self._registrations.values())},
+        )
+
+    def _record(self, name, args, key=None):
+        """Record a registration to replay when unpickling, in place of the
+        one of the same method for the same ``key``, if any."""
+        key = (name, key) if key is not None else object()
+        # Moved last, so replaying keeps the order hooks take effect in.
+        self._registrations.pop(key, None)
+        self._registrations[key] = (name, args)
+
+    def __setstate__(self, state):
+        """Register the hooks of a pickled converter again."""
+        for name, args in state["registrations"]:
+            getattr(self, name)(*args)
+
+    def _config(self):
+        # type: () -> Dict[str, Any]
+        """The keyword arguments to create a converter configured the same."""
+        return {
+            "dict_factory": self._dict_factory,
+            "unstruct_strat": self.unstruct_strat,
+            "dispatch_cache_size": (
+                self._structure_func.dispatch.cache_info().maxsize
+            ),
+            "array_sequences": self._array_sequences,
+            "trust_input": self._trust_input,
+            "lazy_collection_threshold": self._lazy_collection_threshold,
+            "collect_dispatch_stats": self._collect_dispatch_stats,
+        }
+
+    def unstructure(self, obj, projection=None):
+        # type: (Any, Optional[AbstractSet[str]]) -> Any
+        """Convert structured data to unstructured Python data structures.
+
+        With a ``projection``, a set of dotted field paths like
+        ``"author.name"``, ``obj`` must be a dataclass instance, and only
+        the fields on those paths are unstructured. A function doing just
+        that is generated and cached per class and projection. Classes with
+        unstructure hooks of their own can't be projected.
+        """
         logger.debug("Unstructuring obj:", obj)
 
-        return self._unstructure_func.dispatch(obj.__class__)(obj)
+        cl = obj.__class__
+        if projection is not None:
+            return self._projected_fn("unstructure", cl, projection)(obj)
+        handler = self._unstructure_func._direct_dispatch.get(cl)
+        if handler is None:
+            handler = self._unstructure_func.dispatch(cl)
+        else:
+            self._unstructure_func._direct_hit()
+        return handler(obj)
+
+    def unstructure_view(self, obj):
+        # type: (Any) -> Any
+        """Unstructure a dataclass instance into a read-only mapping view.
+
+        The view reads the fields from the instance when accessed, and
+        unstructures them then; nested dataclasses become views too. Nothing
+        is copied upfront. Instances of classes with hooks of their own, and
+        converters unstructuring to tuples, unstructure eagerly instead.
+        """
+        return make_view(self, obj)
 
     @property
     def unstruct_strat(self):
@@ -146,6 +459,34 @@ class Converter(object):
             else UnstructureStrategy.AS_TUPLE
         )
 
+    def dispatch_cache_info(self):
+        # type: () -> Dict[str, DispatchCacheInfo]
+        """Statistics of the hook caches, for sizing them.
+
+        Returns a dict with ``DispatchCacheInfo`` tuples (hits, misses,
+        evictions, maxsize, currsize) for the ``structure`` and
+        ``unstructure`` hook caches.
+        """
+        return {
+            "structure": self._structure_func.cache_info(),
+            "unstructure": self._unstructure_func.cache_info(),
+        }
+
+    def dispatch_stats(self):
+        # type: () -> Dict[str, List[Tuple[Callable, Any, int]]]
+        """How often each predicate hook was chosen, for ordering them.
+
+        Returns a dict with lists of ``(predicate, hook, hits)`` tuples for
+        the ``structure`` and ``unstructure`` predicate hooks, from the
+        highest precedence to the lowest. Hits count the types a hook was
+        resolved for, not the objects it converted. Requires a converter
+        created with ``collect_dispatch_stats``.
+        """
+        return {
+            "structure": self._structure_func.stats(),
+            "unstructure": self._unstructure_func.stats(),
+        }
+
     def register_unstructure_hook(self, cls, func):
         # type: (Type[T], Callable[[T], Any]) -> None
         """Register a class-to-primitive converter function for a class.
@@ -153,13 +494,31 @@ class Converter(object):
         The converter function should take an instance of the class and return
         its Python equivalent.
         """
+        self._record("register_unstructure_hook", (cls, func), cls)
         self._unstructure_func.register_cls_list([(cls, func)])
+        self._reset_projected_fns()
 
     def register_unstructure_hook_func(self, check_func, func):
         """Register a class-to-primitive converter function for a class, using
         a function to check if it's a match.
         """
+        self._record("register_unstructure_hook_func", (check_func, func))
         self._unstructure_func.register_func_list([(check_func, func)])
+        self._reset_projected_fns()
+
+    def register_unstructure_hook_factory(self, predicate, factory):
+        """Register a hook factory for a given predicate.
+
+        A predicate is a function that, given a type, returns whether the
+        factory can produce a hook for that type.
+
+        A factory is a callable that, given a type, produces an unstructuring
+        hook for that type. The produced hook is cached per type until the
+        next hook registration.
+        """
+        self._record("register_unstructure_hook_factory", (predicate, factory))
+        self._unstructure_func.register_func_list([(predicate, factory, True)])
+        self._reset_projected_fns()
 
     def register_structure_hook(self, cl, func):
         """Register a primitive-to-class converter function for a type.
@@ -171,44 +530,482 @@ class Converter(object):
         and return the instance of the class. The type may seem redundant, but
         is sometimes needed (for example, when dealing with generic classes).
         """
+        self._record("register_structure_hook", (cl, func), cl)
         if is_union_type(cl):
-            self._union_registry[cl] = func
+            self._union_registry = {**self._union_registry, cl: func}
+            # Hooks built for the union are cached by the dispatch.
+            self._structure_func.clear_cache()
         else:
             self._structure_func.register_cls_list([(cl, func)])
+        self._reset_field_plans()
+        self._reset_projected_fns()
 
     def register_structure_hook_func(self, check_func, func):
         # type: (Callable[[Any], Any], Callable[[T], Any]) -> None
         """Register a class-to-primitive converter function for a class, using
         a function to check if it's a match.
         """
+        self._record("register_structure_hook_func", (check_func, func))
         self._structure_func.register_func_list([(check_func, func)])
+        self._reset_field_plans()
+        self._reset_projected_fns()
 
-    def structure(self, obj, cl):
-        # type: (Any, Type[T]) -> T
-        """Convert unstructured Python data structures to structured data."""
+    def register_structure_hook_factory(self, predicate, factory):
+        """Register a hook factory for a given predicate.
+
+        A predicate is a function that, given a type, returns whether the
+        factory can produce a hook for that type.
+
+        A factory is a callable that, given a type, produces a structuring
+        hook for that type. The produced hook is cached per type until the
+        next hook registration.
+        """
+        self._record("register_structure_hook_factory", (predicate, factory))
+        self._structure_func.register_func_list([(predicate, factory, True)])
+        self._reset_field_plans()
+        self._reset_projected_fns()
+
+    def register_tagged_union(self, union, tag_key="type", tags=None):
+        # type: (Type, str, Optional[Mapping[Type, Any]]) -> None
+        """Register a union of dataclasses told apart by a tag.
+
+        Unstructured members of the union hold their tag under ``tag_key``.
+        Structuring the union looks the class up by the tag in a dict, and
+        unstructuring a member adds its tag to the dict it unstructures to.
+
+        The tag of a class is taken from ``tags``, a mapping of classes to
+        tags, if it's there. Else, it's the value of a field under
+        ``tag_key`` annotated with a single ``Literal`` value, or with a
+        default, or else the name of the class.
+        """
+        if self.unstruct_strat is not UnstructureStrategy.AS_DICT:
+            raise ValueError("Tagged unions are unstructured to dicts.")
+        classes = [t for t in union.__args__ if t is not NoneType]
+        for cl in classes:
+            if not is_dataclass(get_origin(cl) or cl):
+                raise ValueError("{} is not a dataclass.".format(cl))
+        cls_tags = class_tags(classes, tag_key, tags)
+        dis_func = create_tag_dis_func(cls_tags, tag_key)
+        structure = self.structure
+
+        def structure_tagged(obj, _):
+            return structure(obj, dis_func(obj))
+
+        # Instances of generic dataclasses are of their origin class.
+        runtime_tags = {get_origin(cl) or cl: t for cl, t in cls_tags.items()}
+
+        def unstructure_tagged(cl):
+            base = self._dataclass_unstructure_fn(cl)
+            tag = runtime_tags[cl]
+
+            def unstructure(obj):
+                res = base(obj)
+                res[tag_key] = tag
+                return res
+
+            return unstructure
+
+        self._record("register_tagged_union", (union, tag_key, tags), union)
+        # Optional[union] is a union of its own, so register it too.
+        self._union_registry = {
+            **self._union_registry,
+            union: structure_tagged,
+            Optional[union]: structure_tagged,
+        }
+        self._structure_func.clear_cache()
+        self._unstructure_func.register_func_list(
+            [(runtime_tags.__contains__, unstructure_tagged, True, _CLS)]
+        )
+        self._reset_field_plans()
+        self._reset_projected_fns()
+
+    def structure(self, obj, cl, projection=None):
+        # type: (Any, Type[T], Optional[AbstractSet[str]]) -> T
+        """Convert unstructured Python data structures to structured data.
+
+        With a ``projection``, a set of dotted field paths like
+        ``"author.name"``, ``cl`` must be a dataclass, and only the fields on
+        those paths are structured from the mapping ``obj``; other fields
+        are left to their defaults. Required fields must be projected. A
+        function doing just that is generated and cached per class and
+        projection. Classes with structure hooks of their own can't be
+        projected.
+        """
         logger.debug("Structuring obj:", obj, "class:", cl)
 
-        return self._structure_func.dispatch(cl)(obj, cl)
+        if projection is not None:
+            return self._projected_fn("structure", cl, projection)(obj, cl)
+        handler = self._structure_func._direct_dispatch.get(cl)
+        if handler is None:
+            handler = self._structure_func.dispatch(cl)
+        else:
+            self._structure_func._direct_hit()
+        return handler(obj, cl)
+
+    def _projected_fn(self, direction, cl, projection):
+        """Get the function converting the projected fields of ``cl`` in
+        ``direction``, ``"structure"`` or ``"unstructure"``."""
+        # Registrations swap in a new cache, so functions generated from
+        # the old hooks only go to the discarded one.
+        return self._projected_fns(direction, cl, frozenset(projection))
+
+    def _reset_projected_fns(self):
+        """Drop the functions generated for projections."""
+        self._projected_fns = lru_cache(self._structure_func._cache_size)(
+            self._make_projected_fn
+        )
+
+    def _make_projected_fn(self, direction, cl, projection):
+        """Generate the function for ``_projected_fn``."""
+        if not (is_dataclass(cl) or _is_generic_dataclass(cl)):
+            raise ValueError(
+                "Only dataclasses can be projected, not {}.".format(cl)
+            )
+        if direction == "structure":
+            own_hook = _has_own_hook(
+                self._structure_func,
+                cl,
+                self._structure_dataclass,
+                getattr(self, "gen_structure_dataclass", None),
+                self._gen_structure_generic_dataclass,
+            )
+        else:
+            own_hook = _has_own_hook(
+                self._unstructure_func,
+                cl,
+                self._unstructure_dataclass,
+                getattr(self, "gen_unstructure_dataclass", None),
+            )
+        if own_hook:
+            # The hook could convert any field, or none.
+            raise ValueError(
+                "{} has a {} hook of its own, and can't be projected.".format(
+                    cl, direction
+                )
+            )
+        if direction == "structure":
+            return make_dict_structure_fn(cl, self, _projection=projection)
+        return make_dict_unstructure_fn(
+            cl,
+            self,
+            omit_if_default=getattr(self, "omit_if_default", False),
+            _projection=projection,
+        )
+
+    def structure_lazy(self, obj, cl):
+        # type: (Mapping[str, Any], Type[T]) -> T
+        """Structure a mapping into a dataclass lazily.
+
+        Returns an instance of a subclass of ``cl`` whose fields are
+        structured when first accessed, and then kept. Nested dataclasses are
+        structured lazily too. Only the presence of required fields is
+        checked upfront; ``__init__`` and ``__post_init__`` are not run.
+
+        Classes with hooks of their own, classes structured from tuples, and
+        classes with ``__slots__`` are structured eagerly instead.
+        """
+        return make_lazy(self, obj, cl)
+
+    def structure_many(self, objs, cl, out=None, pause_gc=False):
+        # type: (Iterable[Any], Type[T], Optional[List[T]], bool) -> List[T]
+        """Structure every object of an iterable into ``cl``.
+
+        The hook for ``cl`` is looked up once for the whole batch. Results
+        are appended to ``out`` if given, else to a new list, which is
+        returned. With ``pause_gc``, the cyclic garbage collector is paused
+        while converting.
+        """
+        handler = self._structure_func.dispatch(cl)
+        with _gc_paused(pause_gc):
+            if out is None:
+                return list(map(handler, objs, repeat(cl)))
+            out.extend(map(handler, objs, repeat(cl)))
+            return out
+
+    def unstructure_many(self, objs, out=None, pause_gc=False):
+        # type: (Iterable[Any], Optional[List[Any]], bool) -> List[Any]
+        """Unstructure every object of an iterable.
+
+        The hook is looked up again only when the class of an object differs
+        from the previous one, so homogeneous batches are cheap. Results are
+        appended to ``out`` if given, else to a new list, which is returned.
+        With ``pause_gc``, the cyclic garbage collector is paused while
+        converting.
+        """
+        if out is None:
+            out = []
+        append = out.append
+        dispatch = self._unstructure_func.dispatch
+        last_cl = handler = None
+        with _gc_paused(pause_gc):
+            for obj in objs:
+                cl = obj.__class__
+                if cl is not last_cl:
+                    handler = dispatch(cl)
+                    last_cl = cl
+                append(handler(obj))
+        return out
+
+    def structure_parallel(
+        self, objs, cl, chunk_size=10000, max_workers=None, mp_context=None
+    ):
+        # type: (Iterable[Any], Type[T], int, Optional[int], Any) -> List[T]
+        """Structure every object of an iterable into ``cl``, using a pool of
+        processes.
+
+        The objects are split into chunks of ``chunk_size``, structured by
+        ``max_workers`` worker processes, and returned in order in a list.
+        Each worker gets a copy of this converter, so its hooks, and the
+        predicates and factories they were registered with, have to be
+        picklable; see ``__reduce__``. The objects, ``cl`` and the results
+        are pickled too.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        it = iter(objs)
+        chunks = iter(lambda: list(islice(it, chunk_size)), [])
+        res = []  # type: List[T]
+        with ProcessPoolExecutor(
+            max_workers,
+            mp_context,
+            initializer=_init_worker,
+            initargs=(self, cl),
+        ) as executor:
+            for chunk in executor.map(_structure_chunk, chunks, repeat(cl)):
+                res.extend(chunk)
+        return res
+
+    async def astructure_stream(
+        self, objs, cl, chunk_size=1000, executor=None, max_in_flight=2
+    ):
+        # type: (AsyncIterable[Any], Type[T], int, Any, int) -> AsyncIterator[T]  # noqa: E501
+        """Structure the objects of an async iterable into ``cl``, off the
+        event loop.
+
+        Objects are gathered in chunks of ``chunk_size``, each structured by
+        ``structure_many`` in ``executor`` (the loop's default executor if
+        ``None``), and the results are yielded in order. At most
+        ``max_in_flight`` chunks are submitted at once; reading from
+        ``objs`` waits for the oldest one to be done. With a process pool
+        executor, the converter is pickled along with every chunk.
+        """
+        import asyncio
+
+        if chunk_size < 1 or max_in_flight < 1:
+            raise ValueError("chunk_size and max_in_flight must be positive.")
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        try:
+            chunk = []
+            async for obj in objs:
+                chunk.append(obj)
+                if len(chunk) < chunk_size:
+                    continue
+                pending.append(
+                    loop.run_in_executor(
+                        executor, self.structure_many, chunk, cl
+                    )
+                )
+                chunk = []
+                if len(pending) == max_in_flight:
+                    for res in await pending.popleft():
+                        yield res
+            if chunk:
+                pending.append(
+                    loop.run_in_executor(
+                        executor, self.structure_many, chunk, cl
+                    )
+                )
+            while pending:
+                for res in await pending.popleft():
+                    yield res
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def unstructure_columns(self, objs, cl, column_type=ColumnType.LIST):
+        # type: (Iterable[T], Type[T], ColumnType) -> Dict[str, Any]
+        """Unstructure instances of the dataclass ``cl`` into columns.
+
+        Returns a mapping, built by the dict factory, of every field to the
+        list of its unstructured values. Columns of fields whose declared
+        type is unstructured as is, like ``int`` or ``str``, are copied
+        without dispatching on each value if all values are of exactly that
+        type.
+
+        With ``ColumnType.ARRAY``, ``int`` and ``float`` fields become
+        ``array.array`` columns instead. With ``ColumnType.NUMPY``, ``int``,
+        ``float`` and ``bool`` fields become NumPy arrays; NumPy must be
+        installed. ``int`` columns with values not fitting in 64 bits stay
+        lists.
+        """
+        column_type = ColumnType(column_type)
+        # Fields of these types become NumPy array columns with these
+        # dtypes. NumPy is imported only when needed, as it is slow to.
+        numpy_dtypes = {}
+        if column_type is ColumnType.NUMPY:
+            try:
+                import numpy
+            except ImportError:
+                raise ValueError(
+                    "NumPy columns require NumPy to be installed."
+                ) from None
+            numpy_dtypes = {
+                int: numpy.int64,
+                float: numpy.float64,
+                bool: numpy.bool_,
+            }
+        if not isinstance(objs, Sequence):
+            objs = list(objs)
+        dispatch = self._unstructure_func.dispatch
+        rv = self._dict_factory()
+        for name, obj_name, type_, _ in _field_infos(cl):
+            get = attrgetter(name)
+            column = None
+            if column_type is ColumnType.ARRAY and type_ in _ARRAY_TYPECODES:
+                column = _fitting(
+                    array, _ARRAY_TYPECODES[type_], map(get, objs)
+                )
+            elif type_ in numpy_dtypes:
+                column = _fitting(
+                    numpy.fromiter,
+                    map(get, objs),
+                    numpy_dtypes[type_],
+                    len(objs),
+                )
+            if column is not None:
+                # Packed into an array.
+                pass
+            elif (
+                isinstance(type_, type)
+                and dispatch(type_) == self._unstructure_identity
+            ):
+                # Values may be of subclasses with hooks of their own.
+                column = list(map(get, objs))
+                if not all(v.__class__ is type_ for v in column):
+                    column = self.unstructure_many(column)
+            else:
+                column = self.unstructure_many(map(get, objs))
+            rv[obj_name] = column
+        return rv
+
+    def structure_columns(self, columns, cl):
+        # type: (Mapping[str, Sequence[Any]], Type[T]) -> List[T]
+        """Structure columns, as made by ``unstructure_columns``, into a list
+        of instances of the dataclass ``cl``.
+
+        Columns may be lists, ``array.array`` or NumPy arrays. Missing
+        columns are left to the field defaults, and columns of fields not
+        taken by ``__init__`` are ignored.
+        """
+        init_fields = [f for f in fields(cl) if f.init]
+        init_names = {f.name for f in init_fields}
+        conv_columns = {}
+        for name, obj_name, type_, _, handler in self._field_plans(cl):
+            if name not in init_names:
+                continue
+            try:
+                column = columns[obj_name]
+            except KeyError:
+                continue
+            # Arrays convert to lists of Python scalars faster than the hooks
+            # would.
+            tolist = getattr(column, "tolist", None)
+            if tolist is not None:
+                column = tolist()
+            conv_columns[name] = (
+                list(map(handler, column, repeat(type_)))
+                if handler is not None
+                else column
+            )
+
+        if len(set(map(len, conv_columns.values()))) > 1:
+            raise ValueError("Columns must all have the same length.")
+        names = tuple(conv_columns)
+        if (
+            names
+            and cl.__dataclass_params__.init
+            and names == tuple(f.name for f in init_fields)
+            and not any(getattr(f, "kw_only", False) for f in init_fields)
+        ):
+            # The columns are exactly the positional arguments of the
+            # generated ``__init__``, in order.
+            return list(map(cl, *conv_columns.values()))
+        return [
+            cl(**dict(zip(names, row))) for row in zip(*conv_columns.values())
+        ]
+
+    def structure_iter(self, objs, cl):
+        # type: (Iterable[Any], Type[T]) -> Iterator[T]
+        """Lazily structure every object of an iterable into ``cl``.
+
+        Objects are pulled from ``objs`` and converted one at a time, so the
+        input is never materialized. The hook for ``cl`` is looked up once,
+        when this is called.
+        """
+        return map(self._structure_func.dispatch(cl), objs, repeat(cl))
+
+    def unstructure_iter(self, objs):
+        # type: (Iterable[Any]) -> Iterator[Any]
+        """Lazily unstructure every object of an iterable.
+
+        Like ``unstructure_many``, the hook is looked up again only when the
+        class of an object differs from the previous one.
+        """
+        dispatch = self._unstructure_func.dispatch
+        last_cl = handler = None
+        for obj in objs:
+            cl = obj.__class__
+            if cl is not last_cl:
+                handler = dispatch(cl)
+                last_cl = cl
+            yield handler(obj)
+
+    def _reset_field_plans(self):
+        """Drop the field plans, which hold structuring hooks."""
+        self._field_plans = lru_cache(self._structure_func._cache_size)(
+            self._make_field_plan
+        )
+
+    def _make_field_plan(self, cl):
+        # type: (Type) -> Tuple[_FieldPlan, ...]
+        """Build the field plan of a dataclass, for structuring.
+
+        Use ``_field_plans``, which caches them.
+        """
+        dispatch = self._structure_func.dispatch
+        return tuple(
+            _FieldPlan(
+                *info,
+                dispatch(info.type) if info.type is not None else None,
+            )
+            for info in _field_infos(cl)
+        )
+
+    def _dataclass_unstructure_fn(self, cl):
+        """The default unstructuring hook for the dataclass ``cl``."""
+        return self._unstructure_dataclass
 
     # Classes to Python primitives.
     def unstructure_dataclass_asdict(self, obj):
         # type: (Any) -> Dict[str, Any]
         """Our version of `dataclasses.asdict`, so we can call back to us."""
-        flds = fields(obj.__class__)
         dispatch = self._unstructure_func.dispatch
         rv = self._dict_factory()
-        for f in flds:
-            v = getattr(obj, f.name)
-            in_obj_name = _Modificator(f).obj_name
-
-            rv[in_obj_name] = dispatch(v.__class__)(v)
+        for name, obj_name, _, _ in _field_infos(obj.__class__):
+            v = getattr(obj, name)
+            rv[obj_name] = dispatch(v.__class__)(v)
         return rv
 
     def unstructure_dataclass_astuple(self, obj):
         # type: (Any) -> Tuple
         """Our version of `dataclasses.astuple`, so we can call back to us."""
-        flds = fields(obj.__class__)
-        return tuple(self.unstructure(getattr(obj, f.name)) for f in flds)
+        dispatch = self._unstructure_func.dispatch
+        rv = []
+        for f in _field_infos(obj.__class__):
+            v = getattr(obj, f.name)
+            rv.append(dispatch(v.__class__)(v))
+        return tuple(rv)
 
     def _unstructure_enum(self, obj):
         """Convert an enum to its value."""
@@ -235,6 +1032,14 @@ class Converter(object):
             for k, v in mapping.items()
         )
 
+    def _unstructure_view(self, view):
+        """Convert a dataclass view to what its dataclass converts to."""
+        return self.unstructure(view._obj)
+
+    def _unstructure_lazy_mapping(self, mapping):
+        """Convert a lazy mapping to a dict of primitive equivalents."""
+        return self._unstructure_mapping(dict(mapping))
+
     # Python primitives to classes.
 
     def _structure_default(self, obj, cl):
@@ -248,10 +1053,6 @@ class Converter(object):
         if cl is Any or cl is Optional or cl is None:
             return obj
 
-        if is_generic(cl):
-            fn = make_dict_structure_fn(cl, self)
-            self.register_structure_hook(cl, fn)
-            return fn(obj)
         # We don't know what this is, so we complain loudly.
         msg = (
             "Unsupported type: {0}. Register a structure hook for "
@@ -259,6 +1060,10 @@ class Converter(object):
         )
         raise ValueError(msg)
 
+    def _gen_structure_generic_dataclass(self, cl):
+        """Generate the structuring function for a parametrized dataclass."""
+        return make_dict_structure_fn(cl, self)
+
     def _structure_call(self, obj, cl):
         """Just call ``cl`` with the given ``obj``.
 
@@ -268,6 +1073,33 @@ class Converter(object):
         """
         return cl(obj)
 
+    def _structure_literal(self, obj, literal):
+        """Check ``obj`` is one of the values of a ``Literal`` type."""
+        if obj not in get_args(literal):
+            raise ValueError("{!r} is not a value of {}.".format(obj, literal))
+        return obj
+
+    def _structure_passthrough(self, obj, cl):
+        """``_structure_call``, returning ``obj`` if it's exactly a ``cl``.
+
+        Used instead of ``_structure_call`` when trusting input.
+        """
+        if obj.__class__ is cl:
+            return obj
+        return cl(obj)
+
+    def _all_exactly(self, items, elem_type):
+        """Whether structuring ``items`` into ``elem_type`` can reuse them.
+
+        That is, ``elem_type`` is ``Any``, or it's structured by passing
+        through and all the items are exactly of it.
+        """
+        return elem_type is Any or (
+            self._structure_func.dispatch(elem_type)
+            == self._structure_passthrough
+            and set(map(type, items)) <= {elem_type}
+        )
+
     def _structure_unicode(self, obj, cl):
         """Just call ``cl`` with the given ``obj``"""
         if not isinstance(obj, (bytes, str)):
@@ -281,81 +1113,137 @@ class Converter(object):
         # type: (Tuple, Type[T]) -> T
         """Load an dataclass from a sequence (tuple)."""
         conv_obj = []  # A list of converter parameters.
-        for a, value in zip(tuple(fields(cl)), obj):
+        for f, value in zip(self._field_plans(cl), obj):
             # We detect the type by the metadata.
-            converted = self._structure_dataclass_from_tuple(a, a.name, value)
-            conv_obj.append(converted)
+            handler = f.handler
+            conv_obj.append(
+                handler(value, f.type) if handler is not None else value
+            )
 
         return cl(*conv_obj)  # type: ignore
 
-    def _structure_dataclass_from_tuple(self, a, name, value):
-        """Handle an individual dataclass attribute."""
-        type_ = a.type
-        if type_ is None:
-            # No type metadata.
-            return value
-        return self._structure_func.dispatch(type_)(value, type_)
-
     def structure_dataclass_fromdict(self, obj, cl):
         # type: (Mapping[str, Any], Type[T]) -> T
         """Instantiate an dataclass from a mapping (dict)."""
         # For public use.
         conv_obj = {}  # Start with a fresh dict, to ignore extra keys.
-        dispatch = self._structure_func.dispatch
-        for a in fields(cl):  # type: ignore
-            # We detect the type by metadata.
-            type_ = a.type
-            name = a.name
-            in_obj_name = _Modificator(a).obj_name
-
+        for name, obj_name, type_, _, handler in self._field_plans(cl):
             try:
-                val = obj[in_obj_name]
+                val = obj[obj_name]
             except KeyError:
                 continue
 
             conv_obj[name] = (
-                dispatch(type_)(val, type_) if type_ is not None else val
+                handler(val, type_) if handler is not None else val
             )
 
         return cl(**conv_obj)  # type: ignore
 
+    def _structure_elems(self, obj, elem_type):
+        """Lazily structure every item of ``obj`` into ``elem_type``.
+
+        The hook is looked up once for all the items.
+        """
+        handler = self._structure_func.dispatch(elem_type)
+        if self._is_call_hook(handler):
+            # Primitives and enums: skip a call per item.
+            return map(elem_type, obj)
+        return map(handler, obj, repeat(elem_type))
+
+    def _is_call_hook(self, handler):
+        """Whether ``handler`` structures by calling the type."""
+        return (
+            handler == self._structure_call
+            or handler == self._structure_passthrough
+        )
+
+    def _lazy_hook(self, obj, elem_type):
+        """The hook for the items of ``obj``, if it should be structured
+        into a lazy view, else ``None``."""
+        threshold = self._lazy_collection_threshold
+        if threshold is None or elem_type is Any or len(obj) < threshold:
+            return None
+        handler = self._structure_func.dispatch(elem_type)
+        return None if self._is_call_hook(handler) else handler
+
     def _structure_list(self, obj, cl):
         """Convert an iterable to a potentially generic list."""
-        if is_bare(cl) or cl.__args__[0] is Any:
+        elem_type = Any if is_bare(cl) else cl.__args__[0]
+        if (
+            self._trust_input
+            and obj.__class__ is list
+            and self._all_exactly(obj, elem_type)
+        ):
+            return obj
+        if elem_type is Any:
             return [e for e in obj]
-        else:
-            elem_type = cl.__args__[0]
-            return [
-                self._structure_func.dispatch(elem_type)(e, elem_type)
-                for e in obj
-            ]
+        if obj.__class__ is list or obj.__class__ is tuple:
+            handler = self._lazy_hook(obj, elem_type)
+            if handler is not None:
+                return LazySequence(obj, handler, elem_type)
+        return list(self._structure_elems(obj, elem_type))
+
+    def _structure_array(self, obj, cl):
+        """Convert an iterable to an array of ints or floats, or to a list
+        if the ints don't fit in an array."""
+        elem_type = cl.__args__[0]
+        items = list(self._structure_elems(obj, elem_type))
+        res = _fitting(array, _ARRAY_TYPECODES[elem_type], items)
+        return items if res is None else res
 
     def _structure_set(self, obj, cl):
         """Convert an iterable into a potentially generic set."""
-        if is_bare(cl) or cl.__args__[0] is Any:
+        elem_type = Any if is_bare(cl) else cl.__args__[0]
+        if (
+            self._trust_input
+            and obj.__class__ is set
+            and self._all_exactly(obj, elem_type)
+        ):
+            return obj
+        if elem_type is Any:
             return set(obj)
         else:
-            elem_type = cl.__args__[0]
-            return {
-                self._structure_func.dispatch(elem_type)(e, elem_type)
-                for e in obj
-            }
+            return set(self._structure_elems(obj, elem_type))
 
     def _structure_frozenset(self, obj, cl):
         """Convert an iterable into a potentially generic frozenset."""
-        if is_bare(cl) or cl.__args__[0] is Any:
+        elem_type = Any if is_bare(cl) else cl.__args__[0]
+        if (
+            self._trust_input
+            and obj.__class__ is frozenset
+            and self._all_exactly(obj, elem_type)
+        ):
+            return obj
+        if elem_type is Any:
             return frozenset(obj)
         else:
-            elem_type = cl.__args__[0]
-            dispatch = self._structure_func.dispatch
-            return frozenset(dispatch(elem_type)(e, elem_type) for e in obj)
+            return frozenset(self._structure_elems(obj, elem_type))
 
     def _structure_dict(self, obj, cl):
         """Convert a mapping into a potentially generic dict."""
+        if self._trust_input and obj.__class__ is dict:
+            key_type, val_type = (Any, Any) if is_bare(cl) else cl.__args__
+            if self._all_exactly(obj, key_type) and self._all_exactly(
+                obj.values(), val_type
+            ):
+                return obj
         if is_bare(cl) or cl.__args__ == (Any, Any):
             return dict(obj)
         else:
             key_type, val_type = cl.__args__
+            handler = self._lazy_hook(obj, val_type)
+            if handler is not None:
+                return LazyMapping(
+                    obj,
+                    (
+                        None
+                        if key_type is Any
+                        else self._structure_func.dispatch(key_type)
+                    ),
+                    key_type,
+                    handler,
+                    val_type,
+                )
             if key_type is Any:
                 val_conv = self._structure_func.dispatch(val_type)
                 return {k: val_conv(v, val_type) for k, v in obj.items()}
@@ -370,6 +1258,66 @@ class Converter(object):
                     for k, v in obj.items()
                 }
 
+    def _gen_structure_union(self, union):
+        """Build the structuring hook for a union type.
+
+        Unions use the hook registered for them, or else ``Optional[X]``
+        becomes a ``None`` check in front of the hook for ``X``, and other
+        unions use their disambiguation function. ``None`` is checked for
+        first if it's a member, so hooks never get it.
+        """
+        union_params = union.__args__
+        has_none = NoneType in union_params
+        registered = self._union_registry.get(union)
+        if registered is None and has_none and len(union_params) == 2:
+            other = (
+                union_params[0]
+                if union_params[1] is NoneType
+                else union_params[1]
+            )
+            if is_generating(other):
+                # A recursive type, dispatch when called.
+                handler = self.structure
+            else:
+                handler = self._structure_func.dispatch(other)
+
+            def structure_optional(obj, _):
+                if obj is None:
+                    return None
+                return handler(obj, other)
+
+            hook = structure_optional
+        else:
+            if registered is not None:
+                base = registered
+            else:
+                try:
+                    dis_func = self._dis_func_cache(union)
+                except ValueError:
+                    # Complain when called, as hooks for unions used to.
+                    return self._structure_union
+                dispatch = self._structure_func.dispatch
+                # Hooks of the members, resolved on first use.
+                handlers = {}
+
+                def base(obj, _):
+                    cl = dis_func(obj)
+                    handler = handlers.get(cl)
+                    if handler is None:
+                        handler = handlers[cl] = dispatch(cl)
+                    return handler(obj, cl)
+
+            if has_none:
+
+                def hook(obj, union):
+                    if obj is None:
+                        return None
+                    return base(obj, union)
+
+            else:
+                hook = base
+        return hook
+
     def _structure_union(self, obj, union):
         """Deal with converting a union."""
         # Unions with NoneType in them are basically optionals.
@@ -407,14 +1355,22 @@ class Converter(object):
         else:
             tup_params = tup.__args__
         has_ellipsis = tup_params and tup_params[-1] is Ellipsis
+        if (
+            self._trust_input
+            and obj.__class__ is tuple
+            and (
+                tup_params is None
+                or has_ellipsis
+                and self._all_exactly(obj, tup_params[0])
+            )
+        ):
+            return obj
         if tup_params is None or (has_ellipsis and tup_params[0] is Any):
             # Just a Tuple. (No generic information.)
             return tuple(obj)
         if has_ellipsis:
             # We're dealing with a homogenous tuple, Tuple[int, ...]
-            tup_type = tup_params[0]
-            conv = self._structure_func.dispatch(tup_type)
-            return tuple(conv(e, tup_type) for e in obj)
+            return tuple(self._structure_elems(obj, tup_params[0]))
         else:
             # We're dealing with a heterogenous tuple.
             return tuple(
@@ -433,9 +1389,89 @@ class Converter(object):
                 e for e in union_types if e is not NoneType  # type: ignore
             )
 
-        if not all(is_dataclass(get_origin(e) or e) for e in union_types):
-            raise ValueError(
-                "Only unions of dataclasses supported "
-                "currently. Register a loads hook manually."
-            )
-        return create_uniq_field_dis_func(*union_types)
+        if all(is_dataclass(get_origin(e) or e) for e in union_types):
+            return create_uniq_field_dis_func(*union_types)
+        return create_type_dis_func(
+            *union_types,
+            dataclasses_as_tuples=(
+                self.unstruct_strat is UnstructureStrategy.AS_TUPLE
+            ),
+        )
+
+
+class GenConverter(Converter):
+    """A converter which generates specialized functions for dataclasses.
+
+    The first time a dataclass is structured or unstructured, a function
+    tailored to that class is compiled and cached; it is used for all later
+    conversions of the class. Depending on the unstructuring strategy,
+    the functions convert to and from dicts or tuples.
+
+    With a positive ``inline_depth``, the function generated for a class
+    also converts nested dataclass fields itself, up to that many levels
+    deep, instead of calling their own functions.
+    """
+
+    __slots__ = (
+        "omit_if_default",
+        "inline_depth",
+    )
+
+    def __init__(
+        self,
+        dict_factory=dict,
+        unstruct_strat=UnstructureStrategy.AS_DICT,
+        omit_if_default=False,
+        inline_depth=0,
+        dispatch_cache_size=64,
+        array_sequences=False,
+        trust_input=False,
+        lazy_collection_threshold=None,
+        collect_dispatch_stats=False,
+    ):
+        super().__init__(
+            dict_factory=dict_factory,
+            unstruct_strat=unstruct_strat,
+            dispatch_cache_size=dispatch_cache_size,
+            array_sequences=array_sequences,
+            trust_input=trust_input,
+            lazy_collection_threshold=lazy_collection_threshold,
+            collect_dispatch_stats=collect_dispatch_stats,
+        )
+        self.omit_if_default = omit_if_default
+        self.inline_depth = inline_depth
+
+        self._unstructure_func.register_func_list(
+            [(is_dataclass, self.gen_unstructure_dataclass, True, _CLS)]
+        )
+        self._structure_func.register_func_list(
+            [(is_dataclass, self.gen_structure_dataclass, True, _CLS)]
+        )
+
+    def _config(self):
+        config = super()._config()
+        config["omit_if_default"] = self.omit_if_default
+        config["inline_depth"] = self.inline_depth
+        return config
+
+    def gen_unstructure_dataclass(self, cl):
+        """Generate the unstructuring function for a dataclass."""
+        if self.unstruct_strat is UnstructureStrategy.AS_TUPLE:
+            return make_tuple_unstructure_fn(cl, self)
+        return make_dict_unstructure_fn(
+            cl,
+            self,
+            omit_if_default=self.omit_if_default,
+            _inline_depth=self.inline_depth,
+        )
+
+    def _dataclass_unstructure_fn(self, cl):
+        return self.gen_unstructure_dataclass(cl)
+
+    def gen_structure_dataclass(self, cl):
+        """Generate the structuring function for a dataclass."""
+        if self.unstruct_strat is UnstructureStrategy.AS_TUPLE:
+            return make_tuple_structure_fn(cl, self)
+        return make_dict_structure_fn(
+            cl, self, _inline_depth=self.inline_depth
+        )
@@ -1,58 +1,339 @@
 """Utilities for union (sum type) disambiguation."""
-from collections import OrderedDict
-from dataclasses import fields
-from functools import reduce
-from operator import or_
+from collections import OrderedDict, abc
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
 from typing import (  # noqa: F401, imported for Mypy.
+    Any,
     Callable,
     Dict,
+    List,
     Mapping,
     Optional,
+    Sequence,
     Type,
 )
 
-from convclasses._compat import get_origin
+from convclasses._compat import (
+    get_args,
+    get_origin,
+    is_frozenset,
+    is_literal,
+    is_mapping,
+    is_mutable_set,
+    is_sequence,
+    is_tuple,
+)
+from convclasses.modifiers import _Modificator
+
+
+def _field_keys(cl):
+    """The keys of the dataclass ``cl`` in mappings: required ones, and all."""
+    keys = []
+    required = []
+    for f in fields(get_origin(cl) or cl):
+        key = _Modificator(f).obj_name
+        keys.append(key)
+        if f.default is MISSING and f.default_factory is MISSING:
+            required.append(key)
+    return frozenset(required), frozenset(keys)
+
+
+def _build_tree(candidates, keys):
+    """Build the decision tree telling the candidates apart.
+
+    ``candidates`` are ``(class, required keys, all keys)`` triples. Nodes of
+    the tree are ``(key, present, absent)`` tuples: the subtrees to follow
+    whether the key is in the data or not. Leaves are classes.
+    """
+    if len(candidates) == 1:
+        return candidates[0][0]
+    best = None
+    for key in sorted(keys):
+        # Classes not requiring the key can do without it; classes not
+        # having it likely can't come with it.
+        present = [c for c in candidates if key in c[2]]
+        absent = [c for c in candidates if key not in c[1]]
+        if not present or not absent:
+            continue
+        if len(present) == len(absent) == len(candidates):
+            continue
+        score = (max(len(present), len(absent)), len(present) + len(absent))
+        if best is None or score < best[0]:
+            best = (score, key, present, absent)
+    if best is None:
+        # Key presence can't tell these apart: pick the smallest class,
+        # as the keys of others would have been found.
+        return min(candidates, key=lambda c: len(c[2]))[0]
+    _, key, present, absent = best
+    keys = keys - {key}
+    return (
+        key,
+        _build_tree(present, keys),
+        _build_tree(absent, keys),
+    )
 
 
 def create_uniq_field_dis_func(*classes):
     # type: (*Type) -> Callable
-    """Given attr classes, generate a disambiguation function.
+    """Given dataclasses, generate a disambiguation function.
 
-    The function is based on unique fields."""
+    The function is based on the presence of keys in the data. Keys only one
+    of the classes has are indexed, and looked for first. Failing that, a
+    decision tree built from the required and optional fields of the other
+    classes is followed, testing for one key per level; the tree is
+    balanced greedily, so overlapping field sets are told apart in few
+    probes. Classes are fine as long as their fields aren't all the same."""
     if len(classes) < 2:
         raise ValueError("At least two classes required.")
-    cls_and_attrs = [
-        (cl, set(at.name for at in fields(get_origin(cl) or cl)))
-        for cl in classes
-    ]
-    if len([attrs for _, attrs in cls_and_attrs if len(attrs) == 0]) > 1:
-        raise ValueError("At least two classes have no attributes.")
-    # TODO: Deal with a single class having no required attrs.
-    # For each class, attempt to generate a single unique required field.
-    uniq_data_dict = OrderedDict()  # type: Dict[str, Type]
-    cls_and_attrs.sort(key=lambda c_a: -len(c_a[1]))
-
-    fallback = None  # If none match, try this.
-
-    for i, (cl, cl_reqs) in enumerate(cls_and_attrs):
-        other_classes = cls_and_attrs[i + 1 :]
-        if other_classes:
-            other_reqs = reduce(or_, (c_a[1] for c_a in other_classes))
-            uniq = cl_reqs - other_reqs
-            if not uniq:
-                m = "{} has no usable unique attributes.".format(cl)
-                raise ValueError(m)
-            uniq_data_dict[next(iter(uniq))] = cl
-        else:
-            fallback = cl
+    candidates = []
+    seen = {}  # type: Dict[Any, Type]
+    for cl in classes:
+        required, keys = _field_keys(cl)
+        if (required, keys) in seen:
+            raise ValueError(
+                "{} and {} have the same fields.".format(
+                    seen[required, keys], cl
+                )
+            )
+        seen[required, keys] = cl
+        candidates.append((cl, required, keys))
+
+    owners = {}  # type: Dict[str, List[Type]]
+    for cl, _, keys in candidates:
+        for key in keys:
+            owners.setdefault(key, []).append(cl)
+    uniq = {k: cls[0] for k, cls in owners.items() if len(cls) == 1}
+    uniq_items = tuple(uniq.items())
+    # Without any of their unique keys in the data, classes requiring one
+    # are out.
+    rest = [c for c in candidates if not c[1] & uniq.keys()]
+    if rest:
+        tree = _build_tree(
+            rest, frozenset().union(*(keys for _, _, keys in rest))
+        )
+    else:
+        tree = min(candidates, key=lambda c: len(c[2]))[0]
 
     def dis_func(data):
         # type: (Mapping) -> Optional[Type]
         if not isinstance(data, Mapping):
             raise ValueError("Only input mappings are supported.")
-        for k, v in uniq_data_dict.items():
-            if k in data:
-                return v
-        return fallback
+        # Probe whichever of the data and the index is smaller.
+        if len(data) <= len(uniq_items):
+            for key in data:
+                cl = uniq.get(key)
+                if cl is not None:
+                    return cl
+        else:
+            for key, cl in uniq_items:
+                if key in data:
+                    return cl
+        node = tree
+        while node.__class__ is tuple:
+            node = node[1] if node[0] in data else node[2]
+        return node
+
+    return dis_func
+
+
+def _class_tag(cl, tag_key):
+    """The tag of the dataclass ``cl``, found on the field under
+    ``tag_key``: its single ``Literal`` value, or else its default."""
+    for f in fields(get_origin(cl) or cl):
+        if _Modificator(f).obj_name != tag_key:
+            continue
+        if is_literal(f.type) and len(get_args(f.type)) == 1:
+            return get_args(f.type)[0]
+        if f.default is not MISSING:
+            return f.default
+    return None
+
+
+def class_tags(classes, tag_key, tags=None):
+    # type: (Sequence[Type], str, Optional[Mapping[Type, Any]]) -> Dict[Type, Any]
+    """Map each of the dataclasses to the value tagging it under ``tag_key``.
+
+    The tag of a class is taken from ``tags`` if it's there, else from a
+    field under ``tag_key`` annotated with a single ``Literal`` value or
+    having a default, else it's the name of the class.
+    """
+    res = OrderedDict()  # type: Dict[Type, Any]
+    seen = {}  # type: Dict[Any, Type]
+    tags = tags or {}
+    for cl in classes:
+        if cl in tags:
+            tag = tags[cl]
+        else:
+            tag = _class_tag(cl, tag_key)
+            if tag is None:
+                tag = (get_origin(cl) or cl).__name__
+        if tag in seen:
+            raise ValueError(
+                "{} and {} have the same tag: {!r}.".format(seen[tag], cl, tag)
+            )
+        seen[tag] = cl
+        res[cl] = tag
+    return res
+
+
+def create_tag_dis_func(cls_tags, tag_key):
+    # type: (Mapping[Type, Any], str) -> Callable
+    """Given dataclasses and their tags, generate a disambiguation function.
+
+    The function looks the class up by the value under ``tag_key``."""
+    by_tag = {tag: cl for cl, tag in cls_tags.items()}
+
+    def dis_func(data):
+        # type: (Mapping) -> Type
+        try:
+            return by_tag[data[tag_key]]
+        except (KeyError, TypeError):
+            pass
+        if not isinstance(data, Mapping):
+            raise ValueError("Only input mappings are supported.")
+        if tag_key not in data:
+            raise ValueError("Missing tag: {!r}.".format(tag_key))
+        raise ValueError("Unknown tag: {!r}.".format(data[tag_key]))
+
+    return dis_func
+
+
+def _origin_class(t):
+    origin = get_origin(t) or t
+    return origin if isinstance(origin, type) else None
+
+
+def _pick_container(members, cl):
+    """Pick the container type of ``members`` instances of ``cl`` are best
+    structured into: one of exactly ``cl``, else of a base of ``cl``, else
+    the first."""
+    compatible = [
+        t
+        for t in members
+        if _origin_class(t) is not None and issubclass(cl, _origin_class(t))
+    ]
+    for t in compatible:
+        if _origin_class(t) is cl:
+            return t
+    return (compatible or members)[0]
+
+
+def create_type_dis_func(*types, dataclasses_as_tuples=False):
+    # type: (*Type, bool) -> Callable
+    """Given the members of a union, generate a disambiguation function
+    based on the class of the data.
+
+    A member is picked for a class of data once, and remembered. Data of a
+    class a member is, or a base of it, goes to that member; ``int`` data
+    goes to ``float`` and enum values go to their enum if there's no member
+    for them. Mappings go to dataclasses (disambiguated by their fields)
+    or mapping types, other collections to collection types; dataclasses
+    count as collections with ``dataclasses_as_tuples``. Anything else goes
+    to ``Any``, if it's a member.
+    """
+    exact = {}  # type: Dict[Type, Type]
+    dataclasses = []  # type: List[Type]
+    mappings = []  # type: List[Type]
+    sequences = []  # type: List[Type]
+    catch_all = None
+    values = []  # Enums and literals, typed by their values.
+    for t in types:
+        if t is Any:
+            catch_all = t
+        elif is_dataclass(get_origin(t) or t):
+            dataclasses.append(t)
+        elif is_mapping(t):
+            mappings.append(t)
+        elif (
+            is_sequence(t)
+            or is_mutable_set(t)
+            or is_frozenset(t)
+            or is_tuple(t)
+        ):
+            sequences.append(t)
+        elif is_literal(t):
+            values.extend((v.__class__, t) for v in get_args(t))
+        elif isinstance(t, type):
+            exact.setdefault(t, t)
+            if issubclass(t, Enum):
+                values.extend((m.value.__class__, t) for m in t)
+        else:
+            raise ValueError("Unsupported union member: {}.".format(t))
+    if float in exact:
+        exact.setdefault(int, float)
+    for cl, t in values:
+        exact.setdefault(cl, t)
+
+    if dataclasses_as_tuples:
+        mapping_dataclasses = []
+    else:
+        mapping_dataclasses = dataclasses
+        dataclasses = []
+    if len(mapping_dataclasses) > 1:
+        fields_dis_func = create_uniq_field_dis_func(*mapping_dataclasses)
+    elif mapping_dataclasses:
+        fields_dis_func = None
+    required = {cl: _field_keys(cl)[0] for cl in mapping_dataclasses}
+
+    def mapping_resolver(mapping_member):
+        if not mapping_dataclasses:
+            return None
+        only = mapping_dataclasses[0]
+
+        def resolve(data):
+            cl = only if fields_dis_func is None else fields_dis_func(data)
+            if mapping_member is None or all(
+                key in data for key in required[cl]
+            ):
+                return cl
+            # Not a dataclass after all.
+            return mapping_member
+
+        return resolve
+
+    def pick(cl):
+        """Pick the member, or a resolver, for data of class ``cl``."""
+        for base in cl.__mro__:
+            if base in exact:
+                return exact[base], None
+        if issubclass(cl, abc.Mapping):
+            member = _pick_container(mappings, cl) if mappings else None
+            resolve = mapping_resolver(member)
+            if resolve is not None or member is not None:
+                return member, resolve
+        elif issubclass(cl, (abc.Sequence, abc.Set)) and not issubclass(
+            cl, (str, bytes, bytearray)
+        ):
+            if sequences:
+                return _pick_container(sequences, cl), None
+            if len(dataclasses) == 1 and issubclass(cl, (list, tuple)):
+                return dataclasses[0], None
+        if catch_all is not None:
+            return catch_all, None
+        raise ValueError(
+            "No union member of {} for {}.".format(
+                ", ".join(map(str, types)), cl
+            )
+        )
+
+    # Classes of data to the member to structure into, or to a function
+    # finding it.
+    members = {}  # type: Dict[Type, Type]
+    resolvers = {}  # type: Dict[Type, Callable]
+
+    def dis_func(data):
+        # type: (Any) -> Type
+        cl = data.__class__
+        member = members.get(cl)
+        if member is not None:
+            return member
+        resolve = resolvers.get(cl)
+        if resolve is None:
+            member, resolve = pick(cl)
+            if resolve is None:
+                members[cl] = member
+                return member
+            resolvers[cl] = resolve
+        return resolve(data)
 
     return dis_func
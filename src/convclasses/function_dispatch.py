@@ -1,4 +1,32 @@
-from ._compat import lru_cache
+from typing import TypeVar
+
+from ._compat import get_origin, is_union_type, lru_cache
+
+# Categories of types, used to index the registered predicates.
+CLASS = "class"
+ALIAS = "alias"
+UNION = "union"
+TYPEVAR = "typevar"
+OTHER = "other"
+
+ALL_CATEGORIES = frozenset((CLASS, ALIAS, UNION, TYPEVAR, OTHER))
+
+
+def type_category(typ):
+    """Return the category of a type: a union, a type variable, a typing
+    alias (like ``List[int]``), a plain class or something else."""
+    if is_union_type(typ):
+        return UNION
+    if isinstance(typ, TypeVar):
+        return TYPEVAR
+    try:
+        if get_origin(typ) is not None:
+            return ALIAS
+    except Exception:
+        pass
+    if isinstance(typ, type):
+        return CLASS
+    return OTHER
 
 
 class FunctionDispatch(object):
@@ -8,29 +36,89 @@ class FunctionDispatch(object):
     first argument in the method, and return True or False.
 
     objects that help determine dispatch should be instantiated objects.
+
+    A handler may also be registered as a generator: in that case it is
+    called with the type, and the function it returns is used as the handler
+    for that type. Generated handlers are kept in the dispatch cache only,
+    so they may be generated again once evicted.
+
+    Handlers can be registered for some categories of types only (see
+    ``type_category``); their predicates are then never called with types of
+    other categories. Later registrations take precedence, in any category.
+
+    With ``collect_stats``, the number of types each handler was chosen for
+    is counted; see ``stats``.
+
+    Registering replaces the handler tables and caches instead of changing
+    them, so it's safe while other threads dispatch. Registrations
+    themselves must not run concurrently.
     """
 
-    __slots__ = ("_handler_pairs", "dispatch")
+    __slots__ = (
+        "_handler_pairs",
+        "_buckets",
+        "_hits",
+        "_cache_size",
+        "dispatch",
+    )
 
-    def __init__(self):
-        self._handler_pairs = []
-        self.dispatch = lru_cache(64)(self._dispatch)
+    def __init__(self, cache_size=64, collect_stats=False):
+        self._handler_pairs = ()
+        self._buckets = {category: () for category in ALL_CATEGORIES}
+        self._hits = {} if collect_stats else None
+        self._cache_size = cache_size
+        self.dispatch = lru_cache(cache_size)(self._dispatch)
 
-    def register(self, can_handle, func):
-        self._handler_pairs.insert(0, (can_handle, func))
-        self.dispatch.cache_clear()
+    def register(self, can_handle, func, is_generator=False, categories=None):
+        categories = (
+            ALL_CATEGORIES if categories is None else frozenset(categories)
+        )
+        entry = (can_handle, func, is_generator)
+        buckets = dict(self._buckets)
+        for category in categories:
+            buckets[category] = (entry,) + buckets[category]
+        self._handler_pairs = ((entry, categories),) + self._handler_pairs
+        self._buckets = buckets
+        self.clear_cache()
 
-    def _dispatch(self, typ):
-        """
-        returns the appropriate handler, for the object passed.
-        """
-        for can_handle, handler in self._handler_pairs:
+    def clear_cache(self):
+        """Forget all cached dispatch results and generated handlers."""
+        self.dispatch = lru_cache(self._cache_size)(self._dispatch)
+
+    def stats(self):
+        """Return ``(can_handle, handler, hits)`` for every registration,
+        from the highest precedence to the lowest."""
+        if self._hits is None:
+            raise ValueError("Statistics are not being collected.")
+        return [
+            (entry[0], entry[1], self._hits.get(entry, 0))
+            for entry, _ in self._handler_pairs
+        ]
+
+    def find(self, typ):
+        """Return the ``(can_handle, func, is_generator)`` registration
+        chosen for ``typ``, without generating a handler or counting it."""
+        for entry in self._buckets[type_category(typ)]:
             # can handle could raise an exception here
             # such as issubclass being called on an instance.
             # it's easier to just ignore that case.
             try:
-                if can_handle(typ):
-                    return handler
+                if entry[0](typ):
+                    break
             except Exception:
                 pass
-        raise KeyError("unable to find handler for {0}".format(typ))
+        else:
+            raise KeyError("unable to find handler for {0}".format(typ))
+        return entry
+
+    def _dispatch(self, typ):
+        """
+        returns the appropriate handler, for the object passed.
+        """
+        entry = self.find(typ)
+        if self._hits is not None:
+            self._hits[entry] = self._hits.get(entry, 0) + 1
+        _, handler, is_generator = entry
+        if not is_generator:
+            return handler
+        return handler(typ)
@@ -1,8 +1,19 @@
 import dataclasses
+import inspect
 import re
-from typing import Optional, Sequence, Type, TypeVar
+import threading
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Optional, Type, TypeVar
 
-from ._compat import get_args, get_origin, is_generic, is_sequence
+from ._compat import get_args, get_origin, is_generic, is_union_type
+from .modifiers import _Modificator
+
+NoneType = type(None)
+
+# How many fields of nested dataclasses a generated function may inline in
+# all, so wide classes don't make for huge functions.
+_INLINE_BUDGET = 64
 
 
 @dataclasses.dataclass(frozen=True)
@@ -16,148 +27,386 @@ def override(omit_if_default=None):
 
 _neutral = AttributeOverride()
 
+_state = threading.local()
 
-def make_dict_unstructure_fn(cl, converter, omit_if_default=False, **kwargs):
-    """Generate a specialized dict unstructuring function for a class."""
-    cl_name = cl.__name__
-    fn_name = "unstructure_" + cl_name
-    globs = {"__c_u": converter.unstructure}
+
+def _in_progress():
+    try:
+        return _state.in_progress
+    except AttributeError:
+        _state.in_progress = []
+        return _state.in_progress
+
+
+@contextmanager
+def _generating(cl):
+    """Mark ``cl`` as being generated (or inlined) on this thread."""
+    in_progress = _in_progress()
+    in_progress.append(cl)
+    try:
+        yield
+    finally:
+        in_progress.pop()
+
+
+def is_generating(cl):
+    """Whether a function for ``cl`` is being generated on this thread.
+
+    Handlers for such classes must not be resolved while generating, since
+    that would recurse into generating the same function again.
+    """
+    return cl in _in_progress()
+
+
+def _runtime_class(t):
+    """The concrete class values of a field declared as ``t`` usually have.
+
+    Returns ``None`` if there is no such single class.
+    """
+    if t is Any:
+        return None
+    if is_union_type(t):
+        args = [a for a in t.__args__ if a is not NoneType]
+        return _runtime_class(args[0]) if len(args) == 1 else None
+    if not isinstance(t, type):
+        t = get_origin(t)
+        if not isinstance(t, type):
+            return None
+    if inspect.isabstract(t):
+        return None
+    return t
+
+
+def _optional_arg(t):
+    """Return ``X`` if ``t`` is ``Optional[X]``, else ``None``."""
+    if is_union_type(t) and NoneType in t.__args__ and len(t.__args__) == 2:
+        return t.__args__[0] if t.__args__[1] is NoneType else t.__args__[1]
+    return None
+
+
+def _indent(lines):
+    return ["    " + line for line in lines]
+
+
+def _split_projection(cl, projection):
+    """Group the dotted field paths of ``projection`` by their first field.
+
+    Returns a dict mapping the names of projected fields of ``cl`` to the
+    frozenset of the rest of their paths, or to ``None`` if the whole field
+    is projected.
+    """
+    res = {}
+    for path in projection:
+        name, _, rest = path.partition(".")
+        if not rest or res.get(name, ()) is None:
+            res[name] = None
+        else:
+            res.setdefault(name, set()).add(rest)
+    unknown = set(res) - {f.name for f in dataclasses.fields(cl)}
+    if unknown:
+        raise ValueError(
+            "Unknown fields of {}: {}".format(
+                cl.__qualname__, ", ".join(sorted(unknown))
+            )
+        )
+    return {k: v if v is None else frozenset(v) for k, v in res.items()}
+
+
+def _projected_class(cl, f, t):
+    """The dataclass to project the field ``f`` of ``cl``, declared as
+    ``t``, into."""
+    nested = _optional_arg(t) or t
+    if not isinstance(nested, type) or not dataclasses.is_dataclass(nested):
+        raise ValueError(
+            "Cannot project into {}.{}, which is not a dataclass.".format(
+                cl.__qualname__, f.name
+            )
+        )
+    return nested
+
+
+# Classes checked for being unstructured as is when generating functions.
+_PRIMITIVES = (str, bytes, int, float, bool, NoneType)
+
+
+def _unstructure_globs(converter):
+    """The globals every generated unstructuring function needs."""
+    dispatch = converter._unstructure_func.dispatch
+    return {
+        "__c_d": dispatch,
+        "__c_ids": frozenset(
+            cl
+            for cl in _PRIMITIVES
+            if dispatch(cl) == converter._unstructure_identity
+        ),
+    }
+
+
+def _dispatch_expr(value):
+    """Generate an expression unstructuring ``value`` by its class.
+
+    Values of primitive classes unstructured as is are returned without a
+    call, and others go to the dispatch directly, skipping the overhead of
+    ``Converter.unstructure``.
+    """
+    return (
+        "{v} if {v}.__class__ in __c_ids else __c_d({v}.__class__)({v})"
+    ).format(v=value)
+
+
+def _has_own_hook(dispatch, cl, *defaults):
+    """Whether ``dispatch`` handles the dataclass ``cl`` with a hook of its
+    own, rather than with one of the dataclass hooks ``defaults``."""
+    func, _ = dispatch.find(cl)
+    return not any(func == d for d in defaults)
+
+
+def _unstructure_expr(converter, t, value, globs, names):
+    """Generate an expression unstructuring ``value`` of declared type ``t``.
+
+    The handler for the declared class is resolved now, and used whenever the
+    value is exactly of that class. Other values are unstructured by the
+    handler for their class, looked up at runtime.
+    """
+    cl = _runtime_class(t) if t is not None else None
+    if cl is None or is_generating(cl):
+        return _dispatch_expr(value)
+    conv_function = converter._unstructure_func.dispatch(cl)
+    n = next(names)
+    cl_name = "__cattr_type_{}".format(n)
+    globs[cl_name] = cl
+    if conv_function == converter._unstructure_identity:
+        # Special case this, avoid a function call.
+        hit = value
+    else:
+        unstruct_fn_name = "__cattr_unstruct_{}".format(n)
+        globs[unstruct_fn_name] = conv_function
+        hit = "{}({})".format(unstruct_fn_name, value)
+    return "{hit} if {v}.__class__ is {cl} else {d}".format(
+        hit=hit, v=value, cl=cl_name, d=_dispatch_expr(value)
+    )
+
+
+def _generates(dispatch, t, factory):
+    """Whether ``dispatch`` generates the handler for ``t`` with
+    ``factory``.
+
+    Nothing is generated to tell, so the functions of inlined classes are
+    never compiled unless they're used on their own.
+    """
+    func, is_generator = dispatch.find(t)
+    return is_generator and func == factory
+
+
+def _take_budget(cl, budget):
+    """Take the fields of ``cl`` from the inlining ``budget``, if there are
+    enough left."""
+    n = len(dataclasses.fields(cl))
+    if n > budget[0]:
+        return False
+    budget[0] -= n
+    return True
+
+
+def _inlinable_unstructure(converter, t, depth, budget):
+    """Return the dataclass to inline for a field of type ``t``, if any."""
+    if depth <= 0 or t is None:
+        return None
+    cl = _runtime_class(t)
+    if cl is None or not dataclasses.is_dataclass(cl) or is_generating(cl):
+        return None
+    # Only inline what the converter would have done anyway.
+    if not _generates(
+        converter._unstructure_func,
+        cl,
+        getattr(converter, "gen_unstructure_dataclass", None),
+    ):
+        return None
+    if not _take_budget(cl, budget):
+        return None
+    return cl
+
+
+def _unstructure_lines(
+    cl,
+    converter,
+    src,
+    dst,
+    globs,
+    names,
+    omit_if_default,
+    depth,
+    budget,
+    overrides,
+    projection=None,
+):
+    """Generate statements assigning to ``dst`` the unstructured ``src``.
+
+    ``src`` is a local name bound to an instance of exactly ``cl``. With a
+    ``projection``, as returned by ``_split_projection``, only the projected
+    fields are unstructured.
+    """
     lines = []
+    items = []
     post_lines = []
 
-    fields = cl.__dataclass_fields__  # type: ignore
-
-    lines.append("def {}(i):".format(fn_name))
-    lines.append("    res = {")
-    for field_name, f in fields.items():
-        override = kwargs.pop(field_name, _neutral)
+    for f in dataclasses.fields(cl):
+        field_name = f.name
+        sub = None
+        if projection is not None:
+            if field_name not in projection:
+                continue
+            sub = projection[field_name]
+            if sub is not None and _has_own_hook(
+                converter._unstructure_func,
+                _projected_class(cl, f, f.type),
+                converter._unstructure_dataclass,
+                getattr(converter, "gen_unstructure_dataclass", None),
+            ):
+                # Its hook unstructures the whole field.
+                sub = None
+        override = overrides.pop(field_name, _neutral)
+        key = repr(_Modificator(f).obj_name)
         default = f.default
         default_factory = f.default_factory
-        if f.type is None:
-            # No type annotation, doing runtime dispatch.
-            if (
-                (default is not dataclasses.MISSING)
-                or (default_factory is not dataclasses.MISSING)
-            ) and (
-                (omit_if_default and override.omit_if_default is not False)
-                or override.omit_if_default
-            ):
-                def_name = "__cattr_def_{}".format(field_name)
-
-                if default_factory != dataclasses.MISSING:
-                    globs[def_name] = default_factory
-                    post_lines.append(
-                        "    if i.{name} != {def_name}():".format(
-                            name=field_name, def_name=def_name
-                        )
-                    )
-                    post_lines.append(
-                        "        res['{name}'] = i.{name}".format(
-                            name=field_name
-                        )
-                    )
-                else:
-                    globs[def_name] = default
-                    post_lines.append(
-                        "    if i.{name} != {def_name}:".format(
-                            name=field_name, def_name=def_name
-                        )
-                    )
-                    post_lines.append(
-                        "        res['{name}'] = __c_u(i.{name})".format(
-                            name=field_name
-                        )
-                    )
-
-            else:
-                # No default or no override.
-                lines.append(
-                    "        '{name}': __c_u(i.{name}),".format(
-                        name=field_name
-                    )
+        value = "{}.{}".format(src, field_name)
+        nested = (
+            _inlinable_unstructure(converter, f.type, depth, budget)
+            if sub is None
+            else None
+        )
+        if sub is not None:
+            # Unstructure only the projected fields of the nested dataclass.
+            nested = _projected_class(cl, f, f.type)
+            n = next(names)
+            globs["__cattr_type_{}".format(n)] = nested
+            globs["__c_p_{}".format(n)] = converter._projected_fn(
+                "unstructure", nested, sub
+            )
+            expr = (
+                "__c_p_{n}({v}) if {v}.__class__ is __cattr_type_{n}"
+                " else {d}".format(n=n, v=value, d=_dispatch_expr(value))
+            )
+        elif nested is not None:
+            # Unstructure the nested dataclass right here.
+            n = next(names)
+            val_name = "v{}".format(n)
+            expr = "r{}".format(n)
+            type_name = "__cattr_type_{}".format(n)
+            globs[type_name] = nested
+            with _generating(nested):
+                nested_lines = _unstructure_lines(
+                    nested,
+                    converter,
+                    val_name,
+                    expr,
+                    globs,
+                    names,
+                    omit_if_default,
+                    depth - 1,
+                    budget,
+                    {},
                 )
+            lines.append("{} = {}".format(val_name, value))
+            lines.append("if {}.__class__ is {}:".format(val_name, type_name))
+            lines.extend(_indent(nested_lines))
+            lines.append("else:")
+            lines.append("    {} = {}".format(expr, _dispatch_expr(val_name)))
         else:
-            # Do the dispatch here and now.
-            type = f.type
-            if is_sequence(type):
-                type = Sequence
-            conv_function = converter._unstructure_func.dispatch(type)
-            if (
-                (default is not dataclasses.MISSING)
-                or (default_factory is not dataclasses.MISSING)
-            ) and (
-                (omit_if_default and override.omit_if_default is not False)
-                or override.omit_if_default
-            ):
-                def_name = "__cattr_def_{}".format(field_name)
-
-                if default_factory != dataclasses.MISSING:
-                    # The default is computed every time.
-                    globs[def_name] = default_factory
-                    post_lines.append(
-                        "    if i.{name} != {def_name}():".format(
-                            name=field_name, def_name=def_name
-                        )
-                    )
-                    if conv_function == converter._unstructure_identity:
-                        # Special case this, avoid a function call.
-                        post_lines.append(
-                            "        res['{name}'] = i.{name}".format(
-                                name=field_name
-                            )
-                        )
-                    else:
-                        unstruct_fn_name = "__cattr_unstruct_{}".format(
-                            field_name
-                        )
-                        globs[unstruct_fn_name] = conv_function
-                        post_lines.append(
-                            "        res['{name}'] = {fn}(i.{name}),".format(
-                                name=field_name, fn=unstruct_fn_name
-                            )
-                        )
-                else:
-                    # Default is not a factory, but a constant.
-                    globs[def_name] = default
-                    post_lines.append(
-                        "    if i.{name} != {def_name}:".format(
-                            name=field_name, def_name=def_name
-                        )
+            expr = _unstructure_expr(converter, f.type, value, globs, names)
+        if (
+            (default is not dataclasses.MISSING)
+            or (default_factory is not dataclasses.MISSING)
+        ) and (
+            (omit_if_default and override.omit_if_default is not False)
+            or override.omit_if_default
+        ):
+            def_name = "__cattr_def_{}".format(next(names))
+
+            if default_factory is not dataclasses.MISSING:
+                # The default is computed every time.
+                globs[def_name] = default_factory
+                post_lines.append(
+                    "if {v} != {def_name}():".format(
+                        v=value, def_name=def_name
                     )
-                    if conv_function == converter._unstructure_identity:
-                        post_lines.append(
-                            "        res['{name}'] = i.{name}".format(
-                                name=field_name
-                            )
-                        )
-                    else:
-                        unstruct_fn_name = "__cattr_unstruct_{}".format(
-                            field_name
-                        )
-                        globs[unstruct_fn_name] = conv_function
-                        post_lines.append(
-                            "        res['{name}'] = {fn}(i.{name})".format(
-                                name=field_name, fn=unstruct_fn_name
-                            )
-                        )
+                )
             else:
-                # No omitting of defaults.
-                if conv_function == converter._unstructure_identity:
-                    # Special case this, avoid a function call.
-                    lines.append(
-                        "    '{name}': i.{name},".format(name=field_name)
-                    )
-                else:
-                    unstruct_fn_name = "__cattr_unstruct_{}".format(field_name)
-                    globs[unstruct_fn_name] = conv_function
-                    lines.append(
-                        "    '{name}': {fn}(i.{name}),".format(
-                            name=field_name, fn=unstruct_fn_name
-                        )
-                    )
-    lines.append("    }")
+                # Default is not a factory, but a constant.
+                globs[def_name] = default
+                post_lines.append(
+                    "if {v} != {def_name}:".format(v=value, def_name=def_name)
+                )
+            post_lines.append(
+                "    {dst}[{key}] = {expr}".format(dst=dst, key=key, expr=expr)
+            )
+        else:
+            # No omitting of defaults.
+            items.append((key, expr))
+
+    dict_factory = getattr(converter, "_dict_factory", dict)
+    if dict_factory is dict:
+        lines.append("{} = {{".format(dst))
+        for key, expr in items:
+            lines.append("    {key}: {expr},".format(key=key, expr=expr))
+        lines.append("}")
+    else:
+        globs["__c_df"] = dict_factory
+        lines.append("{} = __c_df()".format(dst))
+        for key, expr in items:
+            lines.append(
+                "{dst}[{key}] = {expr}".format(dst=dst, key=key, expr=expr)
+            )
+
+    return lines + post_lines
+
+
+def make_dict_unstructure_fn(
+    cl,
+    converter,
+    omit_if_default=False,
+    _inline_depth=0,
+    _projection=None,
+    **kwargs,
+):
+    """Generate a specialized dict unstructuring function for a class.
+
+    Keys honor ``mod.name`` renames, and the dict is created using the
+    converter's ``dict_factory``.
+
+    With a positive ``_inline_depth``, nested dataclasses up to that many
+    levels deep are unstructured by the generated function itself instead
+    of through their own hooks, as long as they have no more than
+    ``_INLINE_BUDGET`` fields in all.
+
+    With a ``_projection``, a set of dotted field paths, only the fields
+    on those paths are unstructured.
+    """
+    cl_name = cl.__name__
+    fn_name = "unstructure_" + cl_name
+    globs = _unstructure_globs(converter)
+    if _projection is not None:
+        _projection = _split_projection(cl, _projection)
+        _inline_depth = 0
+
+    with _generating(cl):
+        body = _unstructure_lines(
+            cl,
+            converter,
+            "i",
+            "res",
+            globs,
+            count(),
+            omit_if_default,
+            _inline_depth,
+            [_INLINE_BUDGET],
+            kwargs,
+            _projection,
+        )
 
-    total_lines = lines + post_lines + ["    return res"]
+    total_lines = (
+        ["def {}(i):".format(fn_name)] + _indent(body) + ["    return res"]
+    )
 
     eval(compile("\n".join(total_lines), "", "exec"), globs)
 
@@ -166,6 +415,35 @@ def make_dict_unstructure_fn(cl, converter, omit_if_default=False, **kwargs):
     return fn
 
 
+def make_tuple_unstructure_fn(cl, converter):
+    """Generate a specialized tuple unstructuring function for a class.
+
+    The tuple holds the unstructured fields in definition order, and is
+    built by a single expression.
+    """
+    fn_name = "unstructure_tuple_" + cl.__name__
+    globs = _unstructure_globs(converter)
+    names = count()
+
+    with _generating(cl):
+        items = [
+            "        {},".format(
+                _unstructure_expr(
+                    converter, f.type, "i." + f.name, globs, names
+                )
+            )
+            for f in dataclasses.fields(cl)
+        ]
+
+    total_lines = (
+        ["def {}(i):".format(fn_name), "    return ("] + items + ["    )"]
+    )
+
+    eval(compile("\n".join(total_lines), "", "exec"), globs)
+
+    return globs[fn_name]
+
+
 def generate_mapping(cl: Type, old_mapping):
     mapping = {}
     for p, t in zip(get_origin(cl).__parameters__, get_args(cl)):
@@ -185,19 +463,227 @@ def generate_mapping(cl: Type, old_mapping):
     return cls(**mapping)
 
 
-def make_dict_structure_fn(cl: Type, converter, **kwargs):
-    """Generate a specialized dict structuring function for an attrs class."""
+def _orig_bases_mapping(cl, mapping):
+    """Extend ``mapping`` with the type arguments of the first parametrized
+    generic base of ``cl``."""
+    for base in getattr(cl, "__orig_bases__", ()):
+        if is_generic(base) and not str(base).startswith("typing.Generic"):
+            return generate_mapping(base, mapping)
+    return mapping
+
+
+def _inlinable_structure(converter, t, depth, budget):
+    """Return ``(dataclass, is_optional)`` to inline for type ``t``, if any."""
+    if depth <= 0 or t is None:
+        return None
+    dispatch = converter._structure_func
+    cl = _optional_arg(t)
+    if cl is None:
+        cl = t
+    elif (
+        not _generates(dispatch, t, converter._gen_structure_union)
+        or t in converter._union_registry
+    ):
+        return None
+    if (
+        not isinstance(cl, type)
+        or not dataclasses.is_dataclass(cl)
+        or is_generating(cl)
+    ):
+        return None
+    # Only inline what the converter would have done anyway.
+    if not _generates(
+        dispatch, cl, getattr(converter, "gen_structure_dataclass", None)
+    ):
+        return None
+    if not _take_budget(cl, budget):
+        return None
+    return cl, cl is not t
+
+
+def _has_own_structure_hook(converter, t, cl):
+    """Whether ``t``, the dataclass ``cl`` or an ``Optional`` of it, is
+    structured by a hook of its own."""
+    dispatch = converter._structure_func
+    if cl is not t and (
+        t in converter._union_registry
+        or not _generates(dispatch, t, converter._gen_structure_union)
+    ):
+        return True
+    return _has_own_hook(
+        dispatch,
+        cl,
+        converter._structure_dataclass,
+        getattr(converter, "gen_structure_dataclass", None),
+    )
+
 
+def _structure_expr(converter, t, value, globs, names):
+    """Generate an expression structuring ``value`` into ``t``.
+
+    The handler for ``t`` is resolved now, instead of on every call.
+    """
+    if t is None:
+        # No type metadata.
+        return value
+    n = next(names)
+    globs[f"__c_t_{n}"] = t
+    if is_generating(t):
+        # A recursive type, dispatch when called.
+        return f"__c_s({value}, __c_t_{n})"
+    handler = converter._structure_func.dispatch(t)
+    if t is Any and handler == converter._structure_default:
+        # Passed through as is, avoid a function call.
+        return value
+    globs[f"__c_h_{n}"] = handler
+    return f"__c_h_{n}({value}, __c_t_{n})"
+
+
+def _structure_lines(
+    cl,
+    converter,
+    src,
+    res,
+    globs,
+    names,
+    mapping,
+    depth,
+    budget,
+    overrides,
+    projection=None,
+):
+    """Generate statements building ``res``, the kwargs for ``cl``.
+
+    ``src`` is a local name bound to the mapping to structure from. With a
+    ``projection``, as returned by ``_split_projection``, only the projected
+    fields are structured; the others must have defaults.
+    """
+    lines = []
+    items = []
+    post_lines = []
+
+    for a in dataclasses.fields(cl):
+        an = a.name
+        required = (
+            a.default is dataclasses.MISSING
+            and a.default_factory is dataclasses.MISSING
+        )
+        sub = None
+        if projection is not None:
+            if an not in projection:
+                if required:
+                    raise ValueError(
+                        "Required field {}.{} is not projected.".format(
+                            cl.__qualname__, an
+                        )
+                    )
+                continue
+            sub = projection[an]
+        override = overrides.pop(an, _neutral)
+        type = a.type
+        if isinstance(type, TypeVar):
+            type = getattr(mapping, type.__name__, type)
+        if sub is not None and _has_own_structure_hook(
+            converter, type, _projected_class(cl, a, type)
+        ):
+            # Its hook structures the whole field.
+            sub = None
+
+        kn = repr(
+            _Modificator(a).obj_name
+            if getattr(override, "rename", None) is None
+            else override.rename
+        )
+        # Statements computing the value, if an expression is not enough.
+        block = []
+        nested = (
+            _inlinable_structure(converter, type, depth, budget)
+            if sub is None
+            else None
+        )
+        if sub is not None:
+            # Structure only the projected fields of the nested dataclass.
+            nested_cl = _projected_class(cl, a, type)
+            n = next(names)
+            val = f"r{n}"
+            globs[f"__c_cl_{n}"] = nested_cl
+            globs[f"__c_p_{n}"] = converter._projected_fn(
+                "structure", nested_cl, sub
+            )
+            block.append(f"o{n} = {src}[{kn}]")
+            structured = f"__c_p_{n}(o{n}, __c_cl_{n})"
+            if nested_cl is not type:
+                structured = f"None if o{n} is None else {structured}"
+            block.append(f"{val} = {structured}")
+        elif nested is not None:
+            # Structure the nested dataclass right here.
+            nested_cl, optional = nested
+            n = next(names)
+            val = f"r{n}"
+            globs[f"__c_cl_{n}"] = nested_cl
+            with _generating(nested_cl):
+                nested_lines = _structure_lines(
+                    nested_cl,
+                    converter,
+                    f"o{n}",
+                    f"res{n}",
+                    globs,
+                    names,
+                    _orig_bases_mapping(nested_cl, None),
+                    depth - 1,
+                    budget,
+                    {},
+                )
+            nested_lines.append(f"{val} = __c_cl_{n}(**res{n})")
+            block.append(f"o{n} = {src}[{kn}]")
+            if optional:
+                block.append(f"if o{n} is None:")
+                block.append(f"    {val} = None")
+                block.append("else:")
+                block.extend(_indent(nested_lines))
+            else:
+                block.extend(nested_lines)
+        else:
+            val = _structure_expr(
+                converter, type, f"{src}[{kn}]", globs, names
+            )
+        if required:
+            lines.extend(block)
+            items.append(f"    '{an}': {val},")
+        else:
+            post_lines.append(f"if {kn} in {src}:")
+            post_lines.extend(_indent(block))
+            post_lines.append(f"    {res}['{an}'] = {val}")
+
+    return lines + [f"{res} = {{"] + items + ["}"] + post_lines
+
+
+def make_dict_structure_fn(
+    cl: Type, converter, _inline_depth=0, _projection=None, **kwargs
+):
+    """Generate a specialized dict structuring function for a dataclass.
+
+    Keys honor ``mod.name`` renames, and the handler of every field is
+    resolved once, when the function is generated.
+
+    With a positive ``_inline_depth``, nested dataclasses up to that many
+    levels deep are structured by the generated function itself instead
+    of through their own hooks, as long as they have no more than
+    ``_INLINE_BUDGET`` fields in all.
+
+    With a ``_projection``, a set of dotted field paths, only the fields
+    on those paths are structured, and the others are left to their
+    defaults. Required fields must be projected.
+    """
+
+    orig_cl = cl
     mapping = None
     if is_generic(cl):
         base = get_origin(cl)
         mapping = generate_mapping(cl, mapping)
         cl = base
 
-    for base in getattr(cl, "__orig_bases__", ()):
-        if is_generic(base) and not str(base).startswith("typing.Generic"):
-            mapping = generate_mapping(base, mapping)
-            break
+    mapping = _orig_bases_mapping(cl, mapping)
 
     if isinstance(cl, TypeVar):
         cl = getattr(mapping, cl.__name__, cl)
@@ -209,49 +695,79 @@ def make_dict_structure_fn(cl: Type, converter, **kwargs):
     for p in getattr(cl, "__parameters__", ()):
         # This is nasty, I am not sure how best to handle
         # `typing.List[str]` or `TClass[int, int]` as a parameter type here
-        name_base = getattr(mapping, p.__name__)
+        name_base = getattr(mapping, p.__name__, p)
         name = getattr(name_base, "__name__", str(name_base))
         name = re.sub(r"[\[\.\] ,]", "_", name)
         fn_name += f"_{name}"
 
     globs = {"__c_s": converter.structure, "__cl": cl, "__m": mapping}
-    lines = []
-    post_lines = []
-
-    attrs = dataclasses.fields(cl)
+    if _projection is not None:
+        _projection = _split_projection(cl, _projection)
+        _inline_depth = 0
 
     # if any(isinstance(a.type, str) for a in attrs):
     #     # PEP 563 annotations - need to be resolved.
     #     resolve_types(cl)
 
-    lines.append(f"def {fn_name}(o, *_):")
-    lines.append("  res = {")
-    for a in attrs:
-        an = a.name
-        override = kwargs.pop(an, _neutral)
-        type = a.type
-        if isinstance(type, TypeVar):
-            type = getattr(mapping, type.__name__, type)
-
-        kn = (
-            an
-            if getattr(override, "rename", None) is None
-            else override.rename
+    with _generating(orig_cl):
+        body = _structure_lines(
+            cl,
+            converter,
+            "o",
+            "res",
+            globs,
+            count(),
+            mapping,
+            _inline_depth,
+            [_INLINE_BUDGET],
+            kwargs,
+            _projection,
         )
-        globs[f"__c_t_{an}"] = type
-        if (
-            a.default is dataclasses.MISSING
-            and a.default_factory is dataclasses.MISSING
-        ):
-            lines.append(f"    '{an}': __c_s(o['{kn}'], __c_t_{an}),")
-        else:
-            post_lines.append(f"  if '{kn}' in o:")
-            post_lines.append(
-                f"    res['{an}'] = __c_s(o['{kn}'], __c_t_{an})"
-            )
-    lines.append("    }")
 
-    total_lines = lines + post_lines + ["  return __cl(**res)"]
+    total_lines = (
+        [f"def {fn_name}(o, *_):"] + _indent(body) + ["    return __cl(**res)"]
+    )
+
+    eval(compile("\n".join(total_lines), "", "exec"), globs)
+
+    return globs[fn_name]
+
+
+def make_tuple_structure_fn(cl: Type, converter):
+    """Generate a specialized tuple structuring function for a dataclass.
+
+    The class is instantiated with the structured items as positional
+    arguments, in a single expression. Inputs other than lists and tuples,
+    and inputs with fewer items than fields, are handed to
+    ``converter.structure_dataclass_fromtuple``.
+    """
+    fn_name = "structure_tuple_" + cl.__name__
+    globs = {
+        "__c_s": converter.structure,
+        "__c_fb": converter.structure_dataclass_fromtuple,
+        "__cl": cl,
+    }
+    names = count()
+    fields = dataclasses.fields(cl)
+
+    with _generating(cl):
+        args = [
+            "            {},".format(
+                _structure_expr(converter, a.type, f"o[{i}]", globs, names)
+            )
+            for i, a in enumerate(fields)
+        ]
+
+    total_lines = (
+        [
+            f"def {fn_name}(o, *_):",
+            "    if (o.__class__ is tuple or o.__class__ is list)"
+            f" and len(o) >= {len(fields)}:",
+            "        return __cl(",
+        ]
+        + args
+        + ["        )", "    return __c_fb(o, __cl)"]
+    )
 
     eval(compile("\n".join(total_lines), "", "exec"), globs)
 
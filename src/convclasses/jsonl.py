@@ -0,0 +1,85 @@
+"""Reading and writing JSON Lines files of structured data."""
+import json
+from contextlib import contextmanager
+from itertools import islice
+from os import PathLike
+from typing import (  # noqa: F401, imported for Mypy.
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Type,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _converter(converter):
+    if converter is None:
+        from . import global_converter
+
+        return global_converter
+    return converter
+
+
+@contextmanager
+def _opened(target, mode, encoding):
+    """Open ``target`` if it is a path, else use it as a file object."""
+    if isinstance(target, (str, PathLike)):
+        with open(target, mode, encoding=encoding) as fp:
+            yield fp
+    else:
+        yield target
+
+
+def read_jsonl(source, cl, converter=None, loads=json.loads, encoding="utf-8"):
+    # type: (Union[str, PathLike, IO[str]], Type[T], Any, Callable[[str], Any], str) -> Iterator[T]  # noqa: E501
+    """Lazily structure every line of a JSON Lines file into ``cl``.
+
+    ``source`` is a path or a text file object; paths are opened, and closed
+    once the result is exhausted or closed. Blank lines are skipped. Lines
+    are decoded with ``loads`` and structured with ``converter``, the global
+    converter by default.
+    """
+    converter = _converter(converter)
+    with _opened(source, "r", encoding) as fp:
+        records = (loads(line) for line in fp if not line.isspace())
+        yield from converter.structure_iter(records, cl)
+
+
+def write_jsonl(
+    objs,
+    target,
+    converter=None,
+    dumps=_dumps,
+    batch_size=1000,
+    encoding="utf-8",
+):
+    # type: (Iterable[Any], Union[str, PathLike, IO[str]], Any, Callable[[Any], str], int, str) -> int  # noqa: E501
+    """Unstructure every object of an iterable into a line of a JSON Lines
+    file.
+
+    ``target`` is a path, which is overwritten, or a text file object.
+    Objects are unstructured with ``converter``, the global converter by
+    default, and encoded with ``dumps``; compact JSON by default. Lines are
+    written ``batch_size`` at a time. Returns the number of lines written.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive.")
+    lines = map(dumps, _converter(converter).unstructure_iter(objs))
+    count = 0
+    with _opened(target, "w", encoding) as fp:
+        write = fp.write
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                break
+            count += len(batch)
+            batch.append("")
+            write("\n".join(batch))
+    return count
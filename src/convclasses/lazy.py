@@ -0,0 +1,349 @@
+"""Lazily structured dataclass instances and collections."""
+from collections.abc import Mapping, Sequence
+from dataclasses import MISSING, fields, is_dataclass
+
+from ._compat import lru_cache
+from .gen import _generates
+from .modifiers import _Modificator
+
+# The key of the instance dict holding the converter and source mapping.
+_STATE = "__convclasses_lazy__"
+# Marks items of lazy sequences not structured yet.
+_NOT_DONE = object()
+# The class attribute of lazy classes holding the class they derive from.
+_LAZY_OF = "__convclasses_lazy_of__"
+# How many classes the module-level caches keep. They're bounded so that
+# dynamically created classes can be collected.
+_CLASS_CACHE_SIZE = 1024
+
+
+def _uses_dicts(converter):
+    """Whether the converter's own dataclass hooks use dicts, not tuples."""
+    return converter.unstruct_strat.value == "asdict"
+
+
+def _is_dict_hook(converter, cl, handler):
+    """Whether ``handler`` is the converter's own hook for the dataclass
+    ``cl``, structuring from mappings."""
+    return handler == converter.structure_dataclass_fromdict or (
+        _uses_dicts(converter)
+        and _generates(
+            converter._structure_func,
+            cl,
+            getattr(converter, "gen_structure_dataclass", None),
+        )
+    )
+
+
+class _LazyField(object):
+    """A field of a lazy instance, structured on first access.
+
+    This is a non-data descriptor: once the value is stored in the instance
+    dict, it's found there without going through the descriptor.
+    """
+
+    __slots__ = ("field", "index")
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+
+    def __get__(self, inst, owner):
+        name = self.field.name
+        if inst is None:
+            return getattr(owner.__mro__[1], name)
+        try:
+            converter, src = inst.__dict__[_STATE]
+        except KeyError:
+            raise AttributeError(name) from None
+        plan = converter._field_plans(owner.__mro__[1])[self.index]
+        try:
+            val = src[plan.obj_name]
+        except KeyError:
+            if self.field.default_factory is not MISSING:
+                val = self.field.default_factory()
+            else:
+                val = self.field.default
+        else:
+            cl, handler = plan.type, plan.handler
+            if handler is None:
+                # No type metadata.
+                pass
+            elif isinstance(cl, type) and _is_dict_hook(
+                converter, cl, handler
+            ):
+                # Nested dataclasses are lazy too.
+                val = make_lazy(converter, val, cl)
+            else:
+                val = handler(val, cl)
+        inst.__dict__[name] = val
+        return val
+
+
+def _reduce(self):
+    # Lazy classes can't be found by name, so pickle as the dataclass.
+    cl = self.__class__.__mro__[1]
+    return _restore, (cl, {f.name: getattr(self, f.name) for f in fields(cl)})
+
+
+def _restore(cl, values):
+    inst = object.__new__(cl)
+    inst.__dict__.update(values)
+    return inst
+
+
+@lru_cache(maxsize=_CLASS_CACHE_SIZE)
+def lazy_class(cl):
+    """Create the lazy subclass of the dataclass ``cl``.
+
+    It has the same name and behaves the same, except that instances made by
+    ``make_lazy`` structure their fields on first access. Lazy instances
+    compare equal to instances of ``cl`` with equal fields, and are pickled
+    as instances of ``cl``.
+    """
+    ns = {f.name: _LazyField(f, i) for i, f in enumerate(fields(cl))}
+    ns["__module__"] = cl.__module__
+    ns["__qualname__"] = cl.__qualname__
+    ns["__reduce__"] = _reduce
+    ns[_LAZY_OF] = cl
+    if cl.__dataclass_params__.eq:
+        names = tuple(f.name for f in fields(cl) if f.compare)
+
+        def __eq__(self, other):
+            # Evicted lazy classes may be created again, so any lazy class
+            # of ``cl`` will do.
+            other_cl = other.__class__
+            if (
+                other_cl is not cl
+                and other_cl.__dict__.get(_LAZY_OF) is not cl
+            ):
+                return NotImplemented
+            return tuple(getattr(self, n) for n in names) == tuple(
+                getattr(other, n) for n in names
+            )
+
+        ns["__eq__"] = __eq__
+        ns["__hash__"] = cl.__hash__
+    return type(cl.__name__, (cl,), ns)
+
+
+def make_lazy(converter, obj, cl):
+    """Structure the mapping ``obj`` into a lazy instance of ``cl``.
+
+    Falls back to structuring eagerly if ``cl`` has a hook of its own, or
+    instances of ``cl`` have no ``__dict__``.
+    """
+    handler = converter._structure_func.dispatch(cl)
+    if (
+        not is_dataclass(cl)
+        or not _is_dict_hook(converter, cl, handler)
+        or not cl.__dictoffset__
+    ):
+        return handler(obj, cl)
+    missing = [
+        p.obj_name
+        for p in converter._field_plans(cl)
+        if not p.has_default and p.obj_name not in obj
+    ]
+    if missing:
+        raise TypeError(
+            "Missing required fields for {}: {}".format(
+                cl.__qualname__, ", ".join(missing)
+            )
+        )
+    inst = object.__new__(lazy_class(cl))
+    inst.__dict__[_STATE] = (converter, obj)
+    return inst
+
+
+class LazySequence(Sequence):
+    """A read-only sequence structuring the items of ``src`` on access.
+
+    Structured items are kept, so each is structured at most once.
+    """
+
+    __slots__ = ("_src", "_handler", "_type", "_items")
+
+    def __init__(self, src, handler, type_):
+        self._src = src
+        self._handler = handler
+        self._type = type_
+        self._items = [_NOT_DONE] * len(src)
+
+    def __len__(self):
+        return len(self._src)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._src)))]
+        item = self._items[index]
+        if item is _NOT_DONE:
+            item = self._handler(self._src[index], self._type)
+            self._items[index] = item
+        return item
+
+    def __iter__(self):
+        for i in range(len(self._src)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazySequence)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class LazyMapping(Mapping):
+    """A read-only mapping structuring the values of ``src`` on access.
+
+    Keys, unless their type is ``Any``, are all structured at once, the first
+    time the mapping is used, since looking up a structured key requires
+    them all. Structured values are kept, so each is structured at most once.
+    Checking for a key doesn't structure its value.
+    """
+
+    __slots__ = (
+        "_src",
+        "_key_handler",
+        "_key_type",
+        "_keys",
+        "_handler",
+        "_type",
+        "_values",
+    )
+
+    def __init__(self, src, key_handler, key_type, handler, type_):
+        self._src = src
+        self._key_handler = key_handler
+        self._key_type = key_type
+        self._keys = None
+        self._handler = handler
+        self._type = type_
+        self._values = {}
+
+    def _key_index(self):
+        """Map structured keys to keys of ``src``.
+
+        Keys of type ``Any`` are not structured, and ``src`` itself is
+        returned instead.
+        """
+        keys = self._keys
+        if keys is None:
+            key_handler = self._key_handler
+            if key_handler is None:
+                keys = self._src
+            else:
+                key_type = self._key_type
+                keys = {key_handler(k, key_type): k for k in self._src}
+            self._keys = keys
+        return keys
+
+    def __len__(self):
+        return len(self._key_index())
+
+    def __iter__(self):
+        return iter(self._key_index())
+
+    def __contains__(self, key):
+        return key in self._key_index()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        src_key = key if self._key_handler is None else self._key_index()[key]
+        val = self._handler(self._src[src_key], self._type)
+        self._values[key] = val
+        return val
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, dict(self))
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+@lru_cache(maxsize=_CLASS_CACHE_SIZE)
+def _view_fields(cl):
+    """Map the unstructured keys of the dataclass ``cl`` to its fields."""
+    return {_Modificator(f).obj_name: f for f in fields(cl)}
+
+
+def _is_default(f, val):
+    if f.default is not MISSING:
+        return val == f.default
+    if f.default_factory is not MISSING:
+        return val == f.default_factory()
+    return False
+
+
+class DataclassView(Mapping):
+    """A read-only mapping of the unstructured fields of a dataclass
+    instance.
+
+    Keys honor ``mod.name`` renames. Values are read from the instance and
+    unstructured on every access; nested dataclasses become views too.
+    """
+
+    __slots__ = ("_converter", "_obj", "_fields", "_omit_if_default")
+
+    def __init__(self, converter, obj):
+        self._converter = converter
+        self._obj = obj
+        self._fields = _view_fields(obj.__class__)
+        self._omit_if_default = getattr(converter, "omit_if_default", False)
+
+    def __getitem__(self, key):
+        f = self._fields[key]
+        val = getattr(self._obj, f.name)
+        if self._omit_if_default and _is_default(f, val):
+            raise KeyError(key)
+        return make_view(self._converter, val)
+
+    def __iter__(self):
+        if not self._omit_if_default:
+            return iter(self._fields)
+        obj = self._obj
+        return (
+            key
+            for key, f in self._fields.items()
+            if not _is_default(f, getattr(obj, f.name))
+        )
+
+    def __len__(self):
+        if not self._omit_if_default:
+            return len(self._fields)
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, dict(self))
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def make_view(converter, obj):
+    """Unstructure ``obj`` into a ``DataclassView`` if it's a dataclass
+    instance unstructured into a dict by the converter's own hooks, else
+    eagerly."""
+    cl = obj.__class__
+    handler = converter._unstructure_func.dispatch(cl)
+    if is_dataclass(cl) and (
+        handler == converter.unstructure_dataclass_asdict
+        or _uses_dicts(converter)
+        and _generates(
+            converter._unstructure_func,
+            cl,
+            getattr(converter, "gen_unstructure_dataclass", None),
+        )
+    ):
+        return DataclassView(converter, obj)
+    return handler(obj)
@@ -1,9 +1,22 @@
 from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from typing import NamedTuple, Optional
 
 from ._compat import lru_cache, singledispatch
 from .function_dispatch import FunctionDispatch
 
 
+class DispatchCacheInfo(NamedTuple):
+    """Statistics of a dispatch cache, since its creation."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
 @dataclass
 class _DispatchNotFound(object):
     """ a dummy object to help signify a dispatch not found """
@@ -19,17 +32,65 @@ class MultiStrategyDispatch(object):
     singledispatch is attempted first. If nothing is
     registered for singledispatch, or an exception occurs,
     the FunctionDispatch instance is then used.
+
+    Results are cached in a LRU cache of ``cache_size`` entries. If
+    ``cache_size`` is ``None``, the cache is unbounded and does no LRU
+    bookkeeping.
+
+    Results for the first ``cache_size`` exact classes are also stored in
+    ``_direct_dispatch``, a plain dict callers can check before calling
+    ``dispatch``. Callers report the hits it serves with ``_direct_hit``,
+    so they're counted in the cache statistics.
+
+    Lookups take no lock. Registrations are serialized by a lock and never
+    change the tables lookups may be reading: they build new ones and swap
+    them in, so a lookup racing a registration sees either the old or the
+    new set of hooks, and results computed from the old set are only ever
+    stored in the old caches.
     """
 
-    __slots__ = ("_function_dispatch", "_single_dispatch", "dispatch")
+    __slots__ = (
+        "_function_dispatch",
+        "_single_dispatch",
+        "_cleared_stats",
+        "_direct_dispatch",
+        "_direct_hits",
+        "_direct_hit",
+        "_direct_hit_reads",
+        "_cache_size",
+        "_lock",
+        "dispatch",
+    )
 
-    def __init__(self, fallback_func):
-        self._function_dispatch = FunctionDispatch()
+    def __init__(self, fallback_func, cache_size=64, collect_stats=False):
+        self._function_dispatch = FunctionDispatch(cache_size, collect_stats)
         self._function_dispatch.register(lambda cls: True, fallback_func)
         self._single_dispatch = singledispatch(_DispatchNotFound)
-        self.dispatch = lru_cache(64)(self._dispatch)
+        # Hits, misses and entries dropped by clearing the cache; clearing
+        # resets the statistics of the cache itself.
+        self._cleared_stats = (0, 0, 0)
+        self._direct_dispatch = {}
+        # Counting in C is cheap enough to do on every hit. Reading the
+        # count takes a call too, so reads are subtracted.
+        self._direct_hits = count()
+        self._direct_hit = self._direct_hits.__next__
+        self._direct_hit_reads = 0
+        self._cache_size = cache_size
+        self._lock = Lock()
+        self.dispatch = lru_cache(cache_size)(self._dispatch)
 
     def _dispatch(self, cl):
+        # Fetched first: if a registration swaps the table meanwhile, the
+        # result, which may predate it, goes to the discarded table.
+        direct = self._direct_dispatch
+        handler = self._resolve(cl)
+        if isinstance(cl, type) and (
+            self._cache_size is None or len(direct) < self._cache_size
+        ):
+            direct[cl] = handler
+        return handler
+
+    def _resolve(self, cl):
         try:
             dispatch = self._single_dispatch.dispatch(cl)
             if dispatch is not _DispatchNotFound:
@@ -38,16 +99,83 @@ class MultiStrategyDispatch(object):
             pass
         return self._function_dispatch.dispatch(cl)
 
+    def find(self, cl):
+        """Return ``(func, is_generator)``: the handler ``dispatch`` would
+        use for ``cl``, or the factory it would generate it with, without
+        generating anything."""
+        try:
+            dispatch = self._single_dispatch.dispatch(cl)
+            if dispatch is not _DispatchNotFound:
+                return dispatch, False
+        except Exception:
+            pass
+        _, func, is_generator = self._function_dispatch.find(cl)
+        return func, is_generator
+
     def register_cls_list(self, cls_and_handler):
         """ register a class to singledispatch """
-        for cls, handler in cls_and_handler:
-            self._single_dispatch.register(cls, handler)
-        self.dispatch.cache_clear()
+        with self._lock:
+            single_dispatch = singledispatch(_DispatchNotFound)
+            for cls, handler in self._single_dispatch.registry.items():
+                if cls is not object:
+                    single_dispatch.register(cls, handler)
+            for cls, handler in cls_and_handler:
+                single_dispatch.register(cls, handler)
+            self._single_dispatch = single_dispatch
+            self._clear_cache()
 
     def register_func_list(self, func_and_handler):
         """register a function to determine if the handle
         should be used for the type
+
+        Items are ``(func, handler)`` pairs, or ``(func, factory, True)``
+        triples where ``factory`` is called with the type to produce the
+        handler. A fourth item restricts the registration to some type
+        categories, see ``FunctionDispatch``.
+        """
+        with self._lock:
+            for tup in func_and_handler:
+                self._function_dispatch.register(*tup)
+            self._clear_cache()
+
+    def clear_cache(self):
+        """Drop the cached handlers, for hooks depending on state kept
+        outside of the dispatch."""
+        with self._lock:
+            self._clear_cache()
+
+    def _clear_cache(self):
+        # Generated handlers may have bound other handlers resolved through
+        # this dispatch, so they are dropped along with the cache. The caches
+        # are replaced rather than cleared, see the class docstring.
+        info = self.dispatch.cache_info()
+        hits, misses, dropped = self._cleared_stats
+        self._cleared_stats = (
+            hits + info.hits,
+            misses + info.misses,
+            dropped + info.currsize,
+        )
+        self._function_dispatch.clear_cache()
+        self._direct_dispatch = {}
+        self.dispatch = lru_cache(self._cache_size)(self._dispatch)
+
+    def stats(self):
+        """Return ``(can_handle, handler, hits)`` for every predicate
+        registration, see ``FunctionDispatch.stats``."""
+        return self._function_dispatch.stats()
+
+    def cache_info(self):
+        """Return the statistics of the dispatch cache.
+
+        Every miss adds an entry to the cache, so evictions are the entries
+        added but neither present anymore nor dropped by clearing.
         """
-        for func, handler in func_and_handler:
-            self._function_dispatch.register(func, handler)
-        self.dispatch.cache_clear()
+        info = self.dispatch.cache_info()
+        hits, misses, dropped = self._cleared_stats
+        hits += next(self._direct_hits) - self._direct_hit_reads
+        self._direct_hit_reads += 1
+        misses += info.misses
+        evictions = misses - dropped - info.currsize if info.maxsize else 0
+        return DispatchCacheInfo(
+            hits + info.hits, misses, evictions, info.maxsize, info.currsize
+        )
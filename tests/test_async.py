@@ -0,0 +1,93 @@
+"""Tests for structuring async streams."""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from convclasses import Converter, GenConverter
+
+
+@dataclass
+class Item:
+    id: int
+    tags: List[str]
+
+
+async def items(count, pulled=None):
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        yield {"id": str(i), "tags": ["t"] * (i % 2)}
+        await asyncio.sleep(0)
+
+
+def collect(converter, stream, cl, **kwargs):
+    async def run():
+        return [
+            o async for o in converter.astructure_stream(stream, cl, **kwargs)
+        ]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 100])
+@pytest.mark.parametrize("max_in_flight", [1, 4])
+def test_astructure_stream(chunk_size, max_in_flight):
+    converter = GenConverter()
+
+    res = collect(
+        converter,
+        items(10),
+        Item,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
+
+    assert res == [Item(i, ["t"] * (i % 2)) for i in range(10)]
+
+
+def test_backpressure():
+    """Input is read no further than the chunks in flight."""
+    converter = Converter()
+    pulled = []
+
+    async def run(executor):
+        stream = converter.astructure_stream(
+            items(100, pulled),
+            Item,
+            chunk_size=3,
+            executor=executor,
+            max_in_flight=2,
+        )
+        first = await stream.__anext__()
+        consumed = len(pulled)
+        await stream.aclose()
+        return first, consumed
+
+    with ThreadPoolExecutor(1) as executor:
+        first, consumed = asyncio.run(run(executor))
+
+    assert first == Item(0, [])
+    assert consumed == 3 * 2
+
+
+def test_process_executor():
+    converter = GenConverter()
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(2, context) as executor:
+        res = collect(
+            converter, items(5), Item, chunk_size=2, executor=executor
+        )
+
+    assert res == [Item(i, ["t"] * (i % 2)) for i in range(5)]
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        collect(Converter(), items(1), Item, chunk_size=0)
+    with pytest.raises(ValueError):
+        collect(Converter(), items(1), Item, max_in_flight=0)
@@ -0,0 +1,120 @@
+"""Tests for converting batches of objects."""
+import gc
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import List
+
+from hypothesis import given
+
+from convclasses import Converter, GenConverter
+
+from . import simple_classes
+
+
+@dataclass
+class Row:
+    id: int
+    tags: List[str]
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@given(simple_classes())
+def test_structure_many_like_structure(cl_and_vals):
+    converter = Converter()
+    cl, vals = cl_and_vals
+    objs = [asdict(cl(*vals))] * 3
+
+    assert converter.structure_many(objs, cl) == [
+        converter.structure(o, cl) for o in objs
+    ]
+
+
+def test_structure_many():
+    converter = GenConverter()
+    rows = ({"id": str(i), "tags": ["a"]} for i in range(3))
+
+    assert converter.structure_many(rows, Row) == [
+        Row(0, ["a"]),
+        Row(1, ["a"]),
+        Row(2, ["a"]),
+    ]
+
+
+def test_structure_many_into_list():
+    converter = Converter()
+    out = [Row(0, [])]
+
+    res = converter.structure_many([{"id": 1, "tags": []}], Row, out=out)
+
+    assert res is out
+    assert out == [Row(0, []), Row(1, [])]
+
+
+def test_unstructure_many():
+    """Heterogeneous batches work too."""
+    converter = Converter()
+    objs = [Row(1, ["a"]), Row(2, []), Color.RED, 1, Row(3, [])]
+
+    assert converter.unstructure_many(objs) == [
+        {"id": 1, "tags": ["a"]},
+        {"id": 2, "tags": []},
+        "red",
+        1,
+        {"id": 3, "tags": []},
+    ]
+
+    out = ["x"]
+    assert converter.unstructure_many([Color.RED], out=out) is out
+    assert out == ["x", "red"]
+
+
+def test_pause_gc():
+    converter = Converter()
+    states = []
+
+    def hook(o, _):
+        states.append(gc.isenabled())
+        return o
+
+    converter.register_structure_hook(Row, hook)
+
+    assert gc.isenabled()
+    converter.structure_many([1], Row, pause_gc=True)
+    assert states == [False]
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        converter.structure_many([1], Row, pause_gc=True)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_structure_iter():
+    """Inputs are consumed lazily."""
+    converter = GenConverter()
+    pulled = []
+
+    def rows():
+        for i in range(3):
+            pulled.append(i)
+            yield {"id": i, "tags": []}
+
+    res = converter.structure_iter(rows(), Row)
+
+    assert pulled == []
+    assert next(res) == Row(0, [])
+    assert pulled == [0]
+    assert list(res) == [Row(1, []), Row(2, [])]
+
+
+def test_unstructure_iter():
+    converter = Converter()
+    res = converter.unstructure_iter(iter([Row(1, []), Color.RED]))
+
+    assert next(res) == {"id": 1, "tags": []}
+    assert list(res) == ["red"]
@@ -0,0 +1,197 @@
+"""Tests for columnar conversion."""
+import sys
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from http import HTTPStatus
+from typing import List, Optional
+
+import pytest
+
+from convclasses import ColumnType, Converter, GenConverter, mod
+
+
+class Kind(Enum):
+    A = "a"
+    B = "b"
+
+
+@dataclass
+class Row:
+    id: int
+    score: float
+    ok: bool
+    kind: Kind
+    name: str = mod.name("n")
+    tags: List[str] = field(default_factory=list)
+    parent: Optional[int] = None
+
+
+ROWS = [
+    Row(i, i / 2, i % 2 == 0, Kind.A if i % 3 else Kind.B, str(i), ["t"] * i)
+    for i in range(5)
+]
+COLUMNS = {
+    "id": [0, 1, 2, 3, 4],
+    "score": [0.0, 0.5, 1.0, 1.5, 2.0],
+    "ok": [True, False, True, False, True],
+    "kind": ["b", "a", "a", "b", "a"],
+    "n": ["0", "1", "2", "3", "4"],
+    "tags": [[], ["t"], ["t", "t"], ["t"] * 3, ["t"] * 4],
+    "parent": [None] * 5,
+}
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_roundtrip(converter_cls):
+    converter = converter_cls()
+
+    columns = converter.unstructure_columns(iter(ROWS), Row)
+
+    assert columns == COLUMNS
+    assert converter.structure_columns(columns, Row) == ROWS
+
+
+def test_array_columns():
+    converter = Converter(dict_factory=OrderedDict)
+
+    columns = converter.unstructure_columns(ROWS, Row, "array")
+
+    assert isinstance(columns, OrderedDict)
+    assert columns["id"] == array("q", COLUMNS["id"])
+    assert columns["score"] == array("d", COLUMNS["score"])
+    assert columns["ok"] == COLUMNS["ok"]
+    assert converter.structure_columns(columns, Row) == ROWS
+
+
+@dataclass
+class Big:
+    n: int
+    x: float = 0.0
+
+
+@pytest.mark.parametrize("column_type", ["array", "numpy"])
+def test_big_int_columns(column_type):
+    """Ints not fitting in 64 bits stay in lists."""
+    if column_type == "numpy":
+        pytest.importorskip("numpy")
+    converter = Converter()
+    objs = [Big(1), Big(2 ** 70)]
+
+    columns = converter.unstructure_columns(objs, Big, column_type)
+
+    assert columns["n"] == [1, 2 ** 70]
+    assert type(columns["n"]) is list
+    assert type(columns["x"]) is not list
+    assert converter.structure_columns(columns, Big) == objs
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+    converter = Converter()
+
+    columns = converter.unstructure_columns(ROWS, Row, ColumnType.NUMPY)
+
+    assert columns["id"].dtype == numpy.int64
+    assert columns["score"].dtype == numpy.float64
+    assert columns["ok"].dtype == numpy.bool_
+    assert columns["n"] == COLUMNS["n"]
+    res = converter.structure_columns(columns, Row)
+    assert res == ROWS
+    assert type(res[0].id) is int
+
+
+def test_numpy_columns_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    converter = Converter()
+
+    with pytest.raises(ValueError, match="require NumPy"):
+        converter.unstructure_columns(ROWS, Row, ColumnType.NUMPY)
+    assert converter.unstructure_columns(ROWS, Row) == COLUMNS
+
+
+def test_subclass_values_unstructured():
+    """Values of subclasses of the field type use their own hooks."""
+
+    @dataclass
+    class Response:
+        status: int
+
+    converter = Converter()
+
+    columns = converter.unstructure_columns(
+        [Response(HTTPStatus.OK), Response(404)], Response
+    )
+
+    assert columns == {"status": [200, 404]}
+    assert type(columns["status"][0]) is int
+
+
+def test_structure_missing_columns():
+    converter = Converter()
+    columns = {k: v for k, v in COLUMNS.items() if k != "tags"}
+
+    res = converter.structure_columns(columns, Row)
+
+    assert [r.tags for r in res] == [[]] * 5
+    assert [r.name for r in res] == COLUMNS["n"]
+
+
+@dataclass
+class Total:
+    a: int
+    b: int
+    total: int = field(init=False)
+
+    def __post_init__(self):
+        self.total = self.a + self.b
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_roundtrip_init_false(converter_cls):
+    """Columns of fields not taken by ``__init__`` are ignored."""
+    converter = converter_cls()
+    objs = [Total(1, 2), Total(3, 4)]
+
+    columns = converter.unstructure_columns(objs, Total)
+
+    assert columns == {"a": [1, 3], "b": [2, 4], "total": [3, 7]}
+    assert converter.structure_columns(columns, Total) == objs
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="kw_only is new in Python 3.10."
+)
+def test_roundtrip_kw_only():
+    """Fields are passed by name when not in ``__init__`` order."""
+
+    @dataclass
+    class KwOnly:
+        a: int = field(kw_only=True)
+        b: str
+
+    converter = Converter()
+    objs = [KwOnly(a=1, b="x"), KwOnly(a=2, b="y")]
+
+    columns = converter.unstructure_columns(objs, KwOnly)
+
+    assert converter.structure_columns(columns, KwOnly) == objs
+
+
+def test_structure_uneven_columns():
+    columns = dict(COLUMNS, id=[0])
+
+    with pytest.raises(ValueError):
+        Converter().structure_columns(columns, Row)
+
+
+def test_hooks_are_used():
+    converter = Converter()
+    converter.register_unstructure_hook(Kind, lambda k: k.name)
+    converter.register_structure_hook(Kind, lambda v, _: Kind[v])
+
+    columns = converter.unstructure_columns(ROWS[:2], Row)
+
+    assert columns["kind"] == ["B", "A"]
+    assert converter.structure_columns(columns, Row) == ROWS[:2]
@@ -1,10 +1,17 @@
 """Tests for auto-disambiguators."""
-from dataclasses import asdict, dataclass, fields
+from dataclasses import asdict, dataclass, field, fields, make_dataclass
+from typing import List
 
 import pytest
 from hypothesis import assume, given
 
-from convclasses.disambiguators import create_uniq_field_dis_func
+from convclasses import mod
+from convclasses.disambiguators import (
+    class_tags,
+    create_tag_dis_func,
+    create_type_dis_func,
+    create_uniq_field_dis_func,
+)
 
 from . import simple_classes
 
@@ -80,3 +87,125 @@ def test_disambiguation(cl_and_vals_a, cl_and_vals_b):
     fn = create_uniq_field_dis_func(cl_a, cl_b)
 
     assert fn(asdict(cl_a(*vals_a))) is cl_a
+
+
+def test_class_tags():
+    """Tags come from the table, then the tag field, then the class name."""
+
+    @dataclass
+    class A(object):
+        a: int
+
+    @dataclass
+    class B(object):
+        kind: str = "b"
+
+    @dataclass
+    class C(object):
+        kind: str = mod.name("type", field(default="c"))
+
+    assert class_tags([A, B], "kind") == {A: "A", B: "b"}
+    assert class_tags([A, B], "kind", {B: 2}) == {A: "A", B: 2}
+    assert class_tags([B, C], "type") == {B: "B", C: "c"}
+
+    with pytest.raises(ValueError):
+        class_tags([A, B], "kind", {A: "b"})
+
+
+@given(simple_classes(), simple_classes())
+def test_tag_disambiguation(cl_and_vals_a, cl_and_vals_b):
+    """Tags tell classes apart whatever their fields."""
+    cl_a, vals_a = cl_and_vals_a
+    cl_b, vals_b = cl_and_vals_b
+    fn = create_tag_dis_func({cl_a: "a", cl_b: "b"}, "$tag")
+
+    assert fn({**asdict(cl_a(*vals_a)), "$tag": "a"}) is cl_a
+    assert fn({**asdict(cl_b(*vals_b)), "$tag": "b"}) is cl_b
+    for data in ({"$tag": "c"}, {}, [], {"$tag": []}):
+        with pytest.raises(ValueError):
+            fn(data)
+
+
+def test_overlapping_fields():
+    """Classes without unique fields are told apart by combinations."""
+
+    @dataclass
+    class A(object):
+        a: int
+        b: int
+
+    @dataclass
+    class B(object):
+        b: int
+        c: int
+
+    @dataclass
+    class C(object):
+        a: int
+        c: int
+
+    @dataclass
+    class D(object):
+        a: int
+        b: int = 0
+        d: int = mod.name("e", field(default=0))
+
+    fn = create_uniq_field_dis_func(A, B, C, D)
+
+    assert fn({"a": 1, "b": 1}) is A
+    assert fn({"b": 1, "c": 1}) is B
+    assert fn({"a": 1, "c": 1}) is C
+    assert fn({"a": 1}) is D
+    assert fn({"a": 1, "e": 1}) is D
+
+
+class _CountingDict(dict):
+    probes = 0
+
+    def __contains__(self, key):
+        self.probes += 1
+        return super().__contains__(key)
+
+
+def test_many_classes():
+    """Classes with unique fields are found through an index."""
+    classes = [
+        make_dataclass("C{}".format(i), ["id", "f{}".format(i)])
+        for i in range(32)
+    ]
+    fn = create_uniq_field_dis_func(*classes)
+
+    for cl in classes:
+        assert fn(asdict(cl(1, 2))) is cl
+
+
+def test_decision_tree():
+    """Lookups among classes without unique fields take a logarithmic
+    number of key probes."""
+    classes = [
+        make_dataclass(
+            "C{}".format(i), ["f{}".format(b) for b in range(4) if i >> b & 1]
+        )
+        for i in range(16)
+    ]
+    fn = create_uniq_field_dis_func(*classes)
+
+    for i, cl in enumerate(classes):
+        data = _CountingDict({f.name: 0 for f in fields(cl)})
+        assert fn(data) is cl
+        assert data.probes <= 4
+
+
+def test_type_dis_func():
+    """Subclasses go to the members of their bases."""
+
+    class Str(str):
+        pass
+
+    fn = create_type_dis_func(int, str, List[int])
+
+    assert fn(True) is int
+    assert fn(Str("a")) is str
+    assert fn((1,)) is List[int]
+    with pytest.raises(ValueError):
+        fn(1.5)
@@ -1,6 +1,16 @@
+from typing import List, Optional, TypeVar, Union
+
 import pytest
 
-from convclasses.function_dispatch import FunctionDispatch
+from convclasses.function_dispatch import (
+    ALIAS,
+    CLASS,
+    OTHER,
+    TYPEVAR,
+    UNION,
+    FunctionDispatch,
+    type_category,
+)
 
 
 def test_function_dispatch():
@@ -33,3 +43,70 @@ def test_function_clears_cache_after_function_added():
     assert dispatch.dispatch(Bar) == "foo"
     dispatch.register(lambda cls: issubclass(cls, Bar), "bar")
     assert dispatch.dispatch(Bar) == "bar"
+
+
+def test_type_category():
+    T = TypeVar("T")
+
+    assert type_category(int) == CLASS
+    assert type_category(List[int]) == ALIAS
+    assert type_category(List) == ALIAS
+    assert type_category(Union[int, str]) == UNION
+    assert type_category(Optional[int]) == UNION
+    assert type_category(T) == TYPEVAR
+    assert type_category("int") == OTHER
+
+
+def test_function_dispatch_categories():
+    """Predicates are only tried on types of their categories."""
+    dispatch = FunctionDispatch()
+    seen = []
+
+    def can_handle(typ):
+        seen.append(typ)
+        return True
+
+    dispatch.register(lambda typ: True, "fallback")
+    dispatch.register(can_handle, "class", categories=[CLASS])
+
+    assert dispatch.dispatch(int) == "class"
+    assert dispatch.dispatch(List[int]) == "fallback"
+    assert seen == [int]
+
+
+def test_function_dispatch_categories_keep_order():
+    """Later registrations win, whatever their categories."""
+    dispatch = FunctionDispatch()
+
+    dispatch.register(lambda typ: True, "any")
+    dispatch.register(lambda typ: True, "class", categories=[CLASS])
+    dispatch.register(lambda typ: True, "alias", categories=[ALIAS])
+
+    assert dispatch.dispatch(int) == "class"
+    assert dispatch.dispatch(List[int]) == "alias"
+
+    dispatch.register(lambda typ: True, "any again")
+
+    assert dispatch.dispatch(float) == "any again"
+
+
+def test_function_dispatch_stats():
+    dispatch = FunctionDispatch(collect_stats=True)
+
+    def is_float(cls):
+        return issubclass(cls, float)
+
+    def is_int(cls):
+        return issubclass(cls, int)
+
+    dispatch.register(is_float, "float")
+    dispatch.register(is_int, "int")
+
+    dispatch.dispatch(float)
+    dispatch.dispatch(int)
+    dispatch.dispatch(bool)
+
+    assert dispatch.stats() == [(is_int, "int", 2), (is_float, "float", 1)]
+
+    with pytest.raises(ValueError):
+        FunctionDispatch().stats()
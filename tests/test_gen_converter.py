@@ -0,0 +1,322 @@
+"""Tests for the code-generating converter."""
+from collections import OrderedDict
+from dataclasses import asdict, astuple, dataclass, field, make_dataclass
+from typing import Any, Generic, List, Optional, TypeVar
+
+import pytest
+from hypothesis import given
+
+from convclasses import GenConverter, UnstructureStrategy, mod
+
+from . import nested_classes, simple_classes
+
+T = TypeVar("T")
+
+
+@dataclass
+class Inner:
+    a: int
+
+
+@dataclass
+class Middle:
+    inner: Inner
+    opt: Optional[Inner] = None
+
+
+@dataclass
+class Outer:
+    inner: Inner
+    inners: List[Inner]
+    opt: Optional[Inner] = None
+    untyped: Any = None
+    renamed: str = mod.name("from", field(default="r"))
+
+
+@given(nested_classes | simple_classes())
+def test_unstructure_like_asdict(cl_and_vals):
+    """Generated unstructuring gives the same result as `asdict`."""
+    converter = GenConverter()
+    cl, vals = cl_and_vals
+    inst = cl(*vals)
+
+    assert converter.unstructure(inst) == asdict(inst)
+
+
+def test_unstructure_nested_and_renamed():
+    converter = GenConverter()
+    inst = Outer(Inner(1), [Inner(2)], Inner(3), Inner(4))
+
+    assert converter.unstructure(inst) == {
+        "inner": {"a": 1},
+        "inners": [{"a": 2}],
+        "opt": {"a": 3},
+        "untyped": {"a": 4},
+        "from": "r",
+    }
+
+
+def test_unstructure_dict_factory():
+    converter = GenConverter(dict_factory=OrderedDict)
+    res = converter.unstructure(Outer(Inner(1), []))
+
+    assert isinstance(res, OrderedDict)
+    assert isinstance(res["inner"], OrderedDict)
+    assert list(res) == ["inner", "inners", "opt", "untyped", "from"]
+
+
+def test_generated_function_is_cached():
+    converter = GenConverter()
+    converter.unstructure(Inner(1))
+
+    fn = converter._unstructure_func.dispatch(Inner)
+
+    assert converter._unstructure_func.dispatch(Inner) is fn
+
+
+def test_hooks_registered_later_are_used():
+    """Registering a hook discards the previously generated functions."""
+    converter = GenConverter()
+    inst = Outer(Inner(1), [])
+    converter.unstructure(inst)
+
+    converter.register_unstructure_hook(Inner, lambda i: i.a)
+
+    assert converter.unstructure(inst)["inner"] == 1
+
+
+def test_fields_skip_public_unstructure():
+    """Generated functions dispatch on fields without going through
+    ``unstructure``, which is slower."""
+    calls = []
+
+    class CountingConverter(GenConverter):
+        __slots__ = ()
+
+        def unstructure(self, obj, projection=None):
+            calls.append(obj)
+            return super().unstructure(obj, projection)
+
+    converter = CountingConverter()
+    inst = Outer(Inner(1), [Inner(2)], Inner(3), Inner(4))
+
+    assert converter.unstructure(inst) == GenConverter().unstructure(inst)
+    assert calls == [inst]
+
+
+def test_primitive_hooks_registered_later_are_used():
+    converter = GenConverter()
+    inst = Outer(Inner(1), [], untyped=5)
+    converter.unstructure(inst)
+
+    converter.register_unstructure_hook(int, str)
+
+    assert converter.unstructure(inst)["untyped"] == "5"
+
+
+@given(simple_classes())
+def test_structure_roundtrip(cl_and_vals):
+    """Generated structuring loads what generated unstructuring dumps."""
+    converter = GenConverter()
+    cl, vals = cl_and_vals
+    inst = cl(*vals)
+
+    assert converter.structure(converter.unstructure(inst), cl) == inst
+
+
+def test_structure_nested_and_renamed():
+    converter = GenConverter()
+    data = {"inner": {"a": "1"}, "inners": [{"a": 2}], "from": "f"}
+
+    assert converter.structure(data, Outer) == Outer(
+        Inner(1), [Inner(2)], renamed="f"
+    )
+
+
+def test_structure_hooks_registered_later_are_used():
+    converter = GenConverter()
+    data = {"inner": {"a": 1}, "inners": []}
+    converter.structure(data, Outer)
+
+    converter.register_structure_hook(Inner, lambda o, _: Inner(o["a"] + 1))
+
+    assert converter.structure(data, Outer).inner == Inner(2)
+
+
+def test_omit_if_default():
+    converter = GenConverter(omit_if_default=True)
+
+    assert converter.unstructure(Outer(Inner(1), [])) == {
+        "inner": {"a": 1},
+        "inners": [],
+    }
+
+
+@dataclass
+class Top:
+    middle: Middle
+    middles: List[Middle]
+    opt: Optional[Middle] = None
+
+
+@dataclass
+class Node:
+    value: int
+    child: Any = None
+
+
+# A recursive type, as produced by resolving a forward reference.
+Node.__dataclass_fields__["child"].type = Optional[Node]
+
+
+@dataclass
+class GenericBase(Generic[T]):
+    v: T
+
+
+@dataclass
+class Concrete(GenericBase[int]):
+    pass
+
+
+@dataclass
+class Holder:
+    c: Concrete
+
+
+@pytest.mark.parametrize("inline_depth", [0, 1, 2, 5])
+def test_inlining_roundtrip(inline_depth):
+    converter = GenConverter(inline_depth=inline_depth)
+    inst = Top(
+        Middle(Inner(1), Inner(2)),
+        [Middle(Inner(3))],
+        Middle(Inner(4)),
+    )
+
+    dumped = converter.unstructure(inst)
+
+    assert dumped == asdict(inst)
+    assert converter.structure(dumped, Top) == inst
+    assert converter.structure(
+        {"middle": {"inner": {"a": 1}}, "middles": []}, Top
+    ) == Top(Middle(Inner(1)), [])
+    # Type arguments of generic bases apply to inlined classes too.
+    assert converter.structure({"c": {"v": "1"}}, Holder) == Holder(
+        Concrete(1)
+    )
+
+
+def test_inlining_respects_hooks():
+    """Classes with their own hooks are not inlined."""
+    converter = GenConverter(inline_depth=3)
+    converter.register_unstructure_hook(Inner, lambda i: i.a)
+    converter.register_structure_hook(Inner, lambda o, _: Inner(o))
+    inst = Top(Middle(Inner(1)), [])
+
+    dumped = converter.unstructure(inst)
+
+    assert dumped["middle"] == {"inner": 1, "opt": None}
+    assert converter.structure(dumped, Top) == inst
+
+
+class RecordingConverter(GenConverter):
+    """Records the classes functions are generated for."""
+
+    __slots__ = ("structured", "unstructured")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.structured = set()
+        self.unstructured = set()
+
+    def gen_structure_dataclass(self, cl):
+        self.structured.add(cl)
+        return super().gen_structure_dataclass(cl)
+
+    def gen_unstructure_dataclass(self, cl):
+        self.unstructured.add(cl)
+        return super().gen_unstructure_dataclass(cl)
+
+
+def test_inlined_classes_are_not_compiled():
+    converter = RecordingConverter(inline_depth=1)
+    inst = Middle(Inner(1), Inner(2))
+
+    assert converter.structure(converter.unstructure(inst), Middle) == inst
+    assert converter.unstructured == {Middle}
+    assert converter.structured == {Middle}
+
+
+Wide = make_dataclass("Wide", [("f{}".format(i), int) for i in range(40)])
+
+
+@dataclass
+class Pair:
+    a: Wide
+    b: Wide
+
+
+def test_inlining_budget():
+    """Nested classes are inlined only while they fit the budget."""
+    converter = RecordingConverter(inline_depth=1)
+    inst = Pair(Wide(*range(40)), Wide(*range(40, 80)))
+
+    assert converter.structure(converter.unstructure(inst), Pair) == inst
+    assert converter.unstructured == {Pair, Wide}
+    assert converter.structured == {Pair, Wide}
+
+
+@pytest.mark.parametrize("inline_depth", [0, 3])
+def test_recursive_types(inline_depth):
+    converter = GenConverter(inline_depth=inline_depth)
+    inst = Node(1, Node(2, Node(3)))
+
+    dumped = converter.unstructure(inst)
+
+    assert dumped == {
+        "value": 1,
+        "child": {"value": 2, "child": {"value": 3, "child": None}},
+    }
+    assert converter.structure(dumped, Node) == inst
+
+
+@given(nested_classes | simple_classes())
+def test_unstructure_like_astuple(cl_and_vals):
+    """Generated tuple unstructuring gives the same result as `astuple`."""
+    converter = GenConverter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+    cl, vals = cl_and_vals
+    inst = cl(*vals)
+
+    assert converter.unstructure(inst) == astuple(inst)
+
+
+@given(simple_classes())
+def test_tuple_roundtrip(cl_and_vals):
+    converter = GenConverter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+    cl, vals = cl_and_vals
+    inst = cl(*vals)
+
+    assert converter.structure(converter.unstructure(inst), cl) == inst
+
+
+def test_tuple_structure_short_and_iterables():
+    """Short inputs leave fields to their defaults; any iterable works."""
+    converter = GenConverter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+
+    assert converter.structure(["1"], Middle) == Middle(Inner(1))
+    assert converter.structure(iter([("2",), ("3",)]), Middle) == Middle(
+        Inner(2), Inner(3)
+    )
+
+
+@pytest.mark.parametrize("inline_depth", [0, 3])
+def test_tuple_recursive_types(inline_depth):
+    converter = GenConverter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE, inline_depth=inline_depth
+    )
+    inst = Node(1, Node(2, Node(3)))
+
+    dumped = converter.unstructure(inst)
+
+    assert dumped == (1, (2, (3, None)))
+    assert converter.structure(dumped, Node) == inst
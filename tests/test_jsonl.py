@@ -0,0 +1,77 @@
+"""Tests for JSON Lines reading and writing."""
+import io
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from convclasses import GenConverter
+from convclasses.jsonl import read_jsonl, write_jsonl
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    tags: List[str]
+    parent: Optional[int] = None
+
+
+RECORDS = [Record(i, "é{}".format(i), ["a"] * i) for i in range(5)]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5, 1000])
+def test_roundtrip(tmp_path, batch_size):
+    converter = GenConverter()
+    path = tmp_path / "records.jsonl"
+
+    written = write_jsonl(
+        iter(RECORDS), path, converter, batch_size=batch_size
+    )
+
+    assert written == len(RECORDS)
+    assert path.read_text("utf-8").count("\n") == len(RECORDS)
+    assert list(read_jsonl(str(path), Record, converter)) == RECORDS
+
+
+def test_file_objects():
+    fp = io.StringIO()
+
+    assert write_jsonl(RECORDS[:2], fp) == 2
+    assert fp.getvalue() == (
+        '{"id":0,"name":"é0","tags":[],"parent":null}\n'
+        '{"id":1,"name":"é1","tags":["a"],"parent":null}\n'
+    )
+
+    fp.seek(0)
+    fp.write("\n" + fp.getvalue())
+    fp.seek(0)
+    assert list(read_jsonl(fp, Record)) == RECORDS[:2]
+    assert not fp.closed
+
+
+def test_read_lazily():
+    fp = io.StringIO('{"id":0,"name":"a","tags":[]}\nnot json\n')
+    records = read_jsonl(fp, Record)
+
+    assert next(records) == Record(0, "a", [])
+    with pytest.raises(ValueError):
+        next(records)
+
+
+def test_custom_hooks():
+    converter = GenConverter()
+    converter.register_unstructure_hook(Record, lambda r: r.id)
+    converter.register_structure_hook(Record, lambda i, _: RECORDS[i])
+    fp = io.StringIO()
+
+    write_jsonl(RECORDS, fp, converter)
+
+    assert fp.getvalue() == "0\n1\n2\n3\n4\n"
+    fp.seek(0)
+    assert list(read_jsonl(fp, Record, converter)) == RECORDS
+
+
+def test_empty_batch_size():
+    with pytest.raises(ValueError):
+        write_jsonl([], io.StringIO(), batch_size=0)
@@ -0,0 +1,318 @@
+"""Tests for lazy structuring and unstructuring."""
+import gc
+import json
+import pickle
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, Dict, List, Optional
+
+import pytest
+from hypothesis import given
+
+from convclasses import Converter, GenConverter, UnstructureStrategy, mod
+from convclasses.converters import _field_infos
+from convclasses.lazy import (
+    _CLASS_CACHE_SIZE,
+    DataclassView,
+    LazyMapping,
+    LazySequence,
+    _view_fields,
+    lazy_class,
+)
+
+from . import simple_classes
+
+
+@dataclass
+class Leaf:
+    value: int
+
+
+@dataclass
+class Branch:
+    leaf: Leaf
+    leaves: List[Leaf]
+    opt: Optional[Leaf] = None
+    renamed: str = mod.name("from", field(default="r"))
+    tags: List[str] = field(default_factory=list)
+    untyped: Any = None
+
+
+@dataclass(frozen=True)
+class Frozen:
+    name: str
+    value: int = 0
+
+
+DATA = {
+    "leaf": {"value": "1"},
+    "leaves": [{"value": 2}],
+    "opt": {"value": 3},
+    "from": "f",
+}
+EAGER = Branch(Leaf(1), [Leaf(2)], Leaf(3), "f")
+
+
+@pytest.fixture(params=[Converter, GenConverter])
+def converter(request):
+    return request.param()
+
+
+def test_fields_are_structured_on_access(converter):
+    calls = []
+
+    def structure_leaves(obj, cl):
+        calls.append(obj)
+        return [Leaf(v["value"]) for v in obj]
+
+    converter.register_structure_hook_func(
+        lambda t: t == List[Leaf], structure_leaves
+    )
+    lazy = converter.structure_lazy(DATA, Branch)
+
+    assert isinstance(lazy, Branch)
+    assert lazy.renamed == "f"
+    assert calls == []
+    assert lazy.leaves == [Leaf(2)]
+    assert lazy.leaves is lazy.leaves
+    assert len(calls) == 1
+
+
+def test_nested_dataclasses_are_lazy(converter):
+    lazy = converter.structure_lazy(DATA, Branch)
+
+    leaf = lazy.leaf
+    assert isinstance(leaf, Leaf)
+    assert "value" not in vars(leaf)
+    assert leaf.value == 1
+    assert lazy.opt == Leaf(3)
+
+
+def test_behaves_like_eager(converter):
+    lazy = converter.structure_lazy(DATA, Branch)
+
+    assert lazy == EAGER
+    assert EAGER == lazy
+    assert repr(lazy) == repr(EAGER)
+    assert converter.unstructure(lazy) == converter.unstructure(EAGER)
+    assert lazy.tags == []
+    assert lazy.untyped is None
+
+    lazy.renamed = "changed"
+    assert lazy.renamed == "changed"
+    assert lazy != EAGER
+
+
+@given(simple_classes())
+def test_roundtrip(cl_and_vals):
+    converter = Converter()
+    cl, vals = cl_and_vals
+    inst = cl(*vals)
+
+    assert converter.structure_lazy(converter.unstructure(inst), cl) == inst
+
+
+def test_frozen(converter):
+    lazy = converter.structure_lazy({"name": 1}, Frozen)
+
+    assert lazy == Frozen("1")
+    assert hash(lazy) == hash(Frozen("1"))
+
+
+def test_missing_required_fields(converter):
+    with pytest.raises(TypeError):
+        converter.structure_lazy({"leaves": []}, Branch)
+
+
+def test_pickle(converter):
+    lazy = converter.structure_lazy(DATA, Branch)
+
+    loaded = pickle.loads(pickle.dumps(lazy))
+
+    assert type(loaded) is Branch
+    assert type(loaded.leaf) is Leaf
+    assert loaded == EAGER
+
+
+def test_recreated_lazy_classes_are_equal(converter):
+    lazy = converter.structure_lazy(DATA, Branch)
+    lazy_class.cache_clear()
+
+    assert converter.structure_lazy(DATA, Branch) == lazy
+
+
+def test_class_caches_are_bounded():
+    """Classes are dropped from the module-level caches eventually."""
+    converter = Converter()
+    cl = make_dataclass("Dynamic", [("a", int)])
+    converter.structure_lazy({"a": 1}, cl).a
+    dict(converter.unstructure_view(cl(1)))
+    converter.unstructure_dataclass_asdict(cl(1))
+    ref = weakref.ref(cl)
+    del converter, cl
+
+    for i in range(_CLASS_CACHE_SIZE):
+        other = make_dataclass("Other", [("a", int)])
+        lazy_class(other)
+        _view_fields(other)
+        _field_infos(other)
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_eager_fallbacks():
+    """Classes with their own hooks and tuple converters are eager."""
+    converter = Converter()
+    converter.register_structure_hook(Leaf, lambda v, _: Leaf(v))
+    assert type(converter.structure_lazy({"value": 1}, Leaf)) is Leaf
+    assert type(converter.structure_lazy(DATA, Branch).leaf) is Leaf
+
+    converter = GenConverter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+    assert type(converter.structure_lazy((1,), Leaf)) is Leaf
+
+
+@dataclass
+class Tree:
+    leaves: List[Leaf]
+    named: Dict[str, Leaf]
+    numbers: List[int]
+
+
+TREE = {
+    "leaves": [{"value": i} for i in range(3)],
+    "named": {str(i): {"value": i} for i in range(3)},
+    "numbers": ["1", "2", "3"],
+}
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_lazy_collections(converter_cls):
+    converter = converter_cls(lazy_collection_threshold=3)
+    calls = []
+
+    def structure_leaf(obj, cl):
+        calls.append(obj)
+        return Leaf(obj["value"])
+
+    converter.register_structure_hook(Leaf, structure_leaf)
+    tree = converter.structure(TREE, Tree)
+
+    assert isinstance(tree.leaves, LazySequence)
+    assert isinstance(tree.named, LazyMapping)
+    assert tree.numbers == [1, 2, 3]
+    assert calls == []
+
+    assert tree.leaves[1] == Leaf(1)
+    assert tree.leaves[-1] is tree.leaves[2]
+    assert tree.named["2"] == Leaf(2)
+    assert len(calls) == 3
+    with pytest.raises(KeyError):
+        tree.named["3"]
+
+    assert tree.leaves == [Leaf(0), Leaf(1), Leaf(2)]
+    assert tree.leaves[:2] == [Leaf(0), Leaf(1)]
+    assert tree.named == {str(i): Leaf(i) for i in range(3)}
+    assert len(calls) == 6
+    assert converter.unstructure(tree) == {**TREE, "numbers": [1, 2, 3]}
+    assert pickle.loads(pickle.dumps(tree.named)) == tree.named
+
+
+def test_lazy_collections_threshold():
+    converter = Converter(lazy_collection_threshold=4)
+
+    tree = converter.structure(TREE, Tree)
+
+    assert tree.leaves.__class__ is list
+    assert tree.named.__class__ is dict
+
+
+def test_lazy_mapping_keys():
+    converter = Converter(lazy_collection_threshold=0)
+
+    res = converter.structure({"1": {"value": 1}}, Dict[int, Leaf])
+
+    assert isinstance(res, LazyMapping)
+    assert list(res) == [1]
+    assert res[1] == Leaf(1)
+
+
+def test_lazy_mapping_lookups():
+    """Keys are structured on first use, and values once, on access."""
+    converter = Converter(lazy_collection_threshold=0)
+    calls = []
+
+    def structure_leaf(obj, cl):
+        calls.append(obj)
+        return Leaf(obj["value"])
+
+    def structure_key(obj, cl):
+        calls.append(obj)
+        return int(obj)
+
+    converter.register_structure_hook(Leaf, structure_leaf)
+    converter.register_structure_hook(int, structure_key)
+
+    res = converter.structure(
+        {"1": {"value": 1}, "2": {"value": 2}}, Dict[int, Leaf]
+    )
+    assert calls == []
+
+    assert 1 in res
+    assert 3 not in res
+    assert calls == ["1", "2"]
+    assert res.get(1) is res.get(1) is res[1]
+    assert res.get(3) is None
+    assert calls == ["1", "2", {"value": 1}]
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_unstructure_view(converter_cls):
+    converter = converter_cls()
+    inst = Branch(Leaf(1), [Leaf(2)], None, "f", ["t"], untyped=Leaf(3))
+
+    view = converter.unstructure_view(inst)
+
+    assert isinstance(view, Mapping)
+    assert list(view) == [
+        "leaf",
+        "leaves",
+        "opt",
+        "from",
+        "tags",
+        "untyped",
+    ]
+    assert len(view) == 6
+    assert isinstance(view["leaf"], DataclassView)
+    assert view["leaf"]["value"] == 1
+    assert view["untyped"] == {"value": 3}
+    assert view == converter.unstructure(inst)
+    assert converter.unstructure(view) == converter.unstructure(inst)
+    assert json.loads(json.dumps(view, default=dict)) == view
+    with pytest.raises(KeyError):
+        view["renamed"]
+
+    inst.leaf.value = 5
+    assert view["leaf"]["value"] == 5
+
+
+def test_unstructure_view_omit_if_default():
+    converter = GenConverter(omit_if_default=True)
+    inst = Branch(Leaf(1), [], renamed="f")
+
+    view = converter.unstructure_view(inst)
+
+    assert view == converter.unstructure(inst)
+    assert list(view) == ["leaf", "leaves", "from"]
+    with pytest.raises(KeyError):
+        view["tags"]
+
+
+def test_unstructure_view_eager():
+    converter = Converter()
+    converter.register_unstructure_hook(Leaf, lambda leaf: leaf.value)
+
+    assert converter.unstructure_view(Leaf(1)) == 1
+    assert converter.unstructure_view(Branch(Leaf(1), []))["leaf"] == 1
+    assert converter.unstructure_view([Leaf(1)]) == [1]
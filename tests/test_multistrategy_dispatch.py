@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 from convclasses.multistrategy_dispatch import MultiStrategyDispatch
 
 
@@ -48,3 +51,109 @@ def test_multistrategy_dispatch_conflict_class_wins():
     )
     dispatch.register_cls_list([(Foo, _foo_cls)])
     assert dispatch.dispatch(Foo) == _foo_cls
+
+
+def test_multistrategy_dispatch_cache_info():
+    dispatch = MultiStrategyDispatch(_fallback, cache_size=2)
+
+    class Bar(object):
+        pass
+
+    class Baz(object):
+        pass
+
+    dispatch.dispatch(Foo)
+    dispatch.dispatch(Foo)
+    dispatch.dispatch(Bar)
+    dispatch.dispatch(Baz)
+
+    assert dispatch.cache_info() == (1, 3, 1, 2, 2)
+
+    dispatch.register_cls_list([(Foo, _foo_cls)])
+    dispatch.dispatch(Foo)
+
+    assert dispatch.cache_info() == (1, 4, 1, 2, 1)
+
+
+def test_multistrategy_dispatch_unbounded_cache():
+    dispatch = MultiStrategyDispatch(_fallback, cache_size=None)
+
+    classes = [type("C{}".format(i), (object,), {}) for i in range(100)]
+    for cl in classes + classes:
+        assert dispatch.dispatch(cl) == _fallback
+
+    assert dispatch.cache_info() == (100, 100, 0, None, 100)
+
+
+def test_generated_handlers_bounded():
+    """Generated handlers are kept by the bounded caches only: the LRU
+    cache and the direct table, of ``cache_size`` entries each."""
+    dispatch = MultiStrategyDispatch(_fallback, cache_size=4)
+    refs = []
+
+    def factory(cl):
+        def handler():
+            pass
+
+        refs.append(weakref.ref(handler))
+        return handler
+
+    dispatch.register_func_list([(lambda cls: True, factory, True)])
+    classes = [type("C{}".format(i), (object,), {}) for i in range(20)]
+    for cl in classes:
+        dispatch.dispatch(cl)
+    gc.collect()
+
+    assert len(refs) == 20
+    assert sum(ref() is not None for ref in refs) == 8
+    assert dispatch.cache_info().currsize == 4
+
+
+def test_multistrategy_dispatch_direct_table():
+    """Exact classes are stored in the direct table until a registration."""
+    dispatch = MultiStrategyDispatch(_fallback)
+
+    dispatch.dispatch(Foo)
+    assert dispatch._direct_dispatch == {Foo: _fallback}
+
+    dispatch.register_func_list([(lambda cls: cls is Foo, _foo_func)])
+    assert dispatch._direct_dispatch == {}
+    assert dispatch.dispatch(Foo) == _foo_func
+
+
+def test_registration_during_dispatch():
+    """Results computed before a registration don't land in the new caches."""
+    dispatch = MultiStrategyDispatch(_fallback)
+
+    def register_meanwhile(cls):
+        dispatch.register_cls_list([(Foo, _foo_cls)])
+        return False
+
+    dispatch.register_func_list([(register_meanwhile, _foo_func)])
+    old_direct = dispatch._direct_dispatch
+
+    assert dispatch.dispatch(Foo) is _fallback
+    assert old_direct == {Foo: _fallback}
+    assert dispatch._direct_dispatch == {}
+    assert dispatch.dispatch(Foo) is _foo_cls
+
+
+def test_registration_keeps_cls_hooks():
+    dispatch = MultiStrategyDispatch(_fallback)
+    dispatch.register_cls_list([(Foo, _foo_cls)])
+    dispatch.register_cls_list([(int, _foo_func)])
+
+    assert dispatch.dispatch(Foo) is _foo_cls
+    assert dispatch.dispatch(int) is _foo_func
+    assert dispatch.dispatch(str) is _fallback
+
+
+def test_clear_cache():
+    dispatch = MultiStrategyDispatch(_fallback)
+    dispatch.dispatch(Foo)
+
+    dispatch.clear_cache()
+
+    assert dispatch._direct_dispatch == {}
+    assert dispatch.dispatch.cache_info().currsize == 0
+    assert dispatch.cache_info().misses == 1
@@ -0,0 +1,133 @@
+"""Tests for pickling converters and structuring in worker processes."""
+import multiprocessing
+import pickle
+from array import array
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import pytest
+
+from convclasses import Converter, GenConverter, UnstructureStrategy
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Shape:
+    points: List[Point]
+
+
+def structure_point(obj, _):
+    return Point(*obj)
+
+
+def unstructure_point(point):
+    return [point.x, point.y]
+
+
+def is_point(cl):
+    return cl is Point
+
+
+def converter_for(converter_cls):
+    converter = converter_cls()
+    converter.register_structure_hook(Point, structure_point)
+    converter.register_unstructure_hook_func(is_point, unstructure_point)
+    return converter
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_pickle_hooks(converter_cls):
+    converter = pickle.loads(pickle.dumps(converter_for(converter_cls)))
+    shape = Shape([Point(1, 2)])
+
+    assert converter.unstructure(shape) == {"points": [[1, 2]]}
+    assert converter.structure({"points": [[1, 2]]}, Shape) == shape
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_pickle_self_bound_hooks(converter_cls):
+    """Hooks may be bound methods of the converter being pickled."""
+    converter = converter_cls()
+    converter.register_unstructure_hook(
+        Point, converter.unstructure_dataclass_astuple
+    )
+    converter.register_structure_hook(
+        Point, converter.structure_dataclass_fromtuple
+    )
+
+    copy = pickle.loads(pickle.dumps(converter))
+    shape = Shape([Point(1, 2)])
+
+    assert copy.unstructure(shape) == {"points": [(1, 2)]}
+    assert copy.structure({"points": [[1, 2]]}, Shape) == shape
+    hook = copy._unstructure_func.dispatch(Point)
+    assert hook.__self__ is copy
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_pickle_replaced_hooks(converter_cls):
+    """Hooks registered again for a class replace the pickled ones."""
+    converter = converter_cls()
+    once = converter_cls()
+    once.register_unstructure_hook(Point, str)
+    for _ in range(100):
+        converter.register_unstructure_hook(Point, repr)
+    converter.register_unstructure_hook(Point, str)
+
+    dumped = pickle.dumps(converter)
+
+    assert len(dumped) == len(pickle.dumps(once))
+    assert pickle.loads(dumped).unstructure(Point(1, 2)) == str(Point(1, 2))
+
+
+def test_pickle_config():
+    converter = GenConverter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE,
+        omit_if_default=True,
+        inline_depth=2,
+        dispatch_cache_size=None,
+        array_sequences=True,
+        trust_input=True,
+        lazy_collection_threshold=10,
+        collect_dispatch_stats=True,
+    )
+    converter.omit_if_default = False
+
+    copy = pickle.loads(pickle.dumps(converter))
+
+    assert type(copy) is GenConverter
+    assert copy.unstruct_strat is UnstructureStrategy.AS_TUPLE
+    assert not copy.omit_if_default
+    assert copy.inline_depth == 2
+    assert copy.dispatch_cache_info()["structure"].maxsize is None
+    assert copy.structure([1], Sequence[int]) == array("q", [1])
+    ints = [1]
+    assert copy.structure(ints, List[int]) is ints
+    assert copy._lazy_collection_threshold == 10
+    assert copy.dispatch_stats()["structure"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_structure_parallel(chunk_size):
+    converter = converter_for(GenConverter)
+    objs = [{"points": [[i, i]] * (i % 3)} for i in range(10)]
+
+    res = converter.structure_parallel(
+        iter(objs),
+        Shape,
+        chunk_size=chunk_size,
+        max_workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert res == converter.structure_many(objs, Shape)
+
+
+def test_structure_parallel_chunk_size():
+    with pytest.raises(ValueError):
+        Converter().structure_parallel([], int, chunk_size=0)
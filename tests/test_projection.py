@@ -0,0 +1,204 @@
+"""Tests for structuring and unstructuring projections of dataclasses."""
+from dataclasses import dataclass, field, fields
+from typing import Optional, Union
+
+import pytest
+from hypothesis import given
+
+from convclasses import Converter, GenConverter, mod
+
+from . import simple_classes
+
+
+@dataclass
+class Tag:
+    name: str
+    color: str = "red"
+
+
+@dataclass
+class Author:
+    name: str
+    email: str = ""
+    tag: Optional[Tag] = None
+
+
+@dataclass
+class Post:
+    id: int
+    title: str = ""
+    author: Author = field(default_factory=lambda: Author("anonymous"))
+    body: str = mod.name("content", field(default=""))
+
+
+POST = Post(1, "Title", Author("Ann", "ann@x", Tag("a")), "Text")
+
+
+@given(simple_classes())
+def test_project_all_fields(cl_and_vals):
+    """Projecting every field is the same as not projecting."""
+    converter = Converter()
+    cl, vals = cl_and_vals
+    obj = cl(*vals)
+    projection = {f.name for f in fields(cl)}
+
+    assert converter.unstructure(obj, projection=projection) == (
+        converter.unstructure(obj)
+    )
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_unstructure_projection(converter_cls):
+    converter = converter_cls()
+
+    assert converter.unstructure(
+        POST, projection={"id", "body", "author.name", "author.tag.name"}
+    ) == {
+        "id": 1,
+        "author": {"name": "Ann", "tag": {"name": "a"}},
+        "content": "Text",
+    }
+    assert converter.unstructure(
+        Post(2, author=Author("Bob")), projection={"author.tag.name"}
+    ) == {"author": {"tag": None}}
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_structure_projection(converter_cls):
+    converter = converter_cls()
+    obj = {
+        "id": "1",
+        "title": "ignored",
+        "author": {"name": "Ann", "email": "ignored", "tag": {"name": "a"}},
+        "content": "Text",
+    }
+
+    assert converter.structure(
+        obj, Post, projection={"id", "body", "author.name", "author.tag"}
+    ) == Post(1, author=Author("Ann", tag=Tag("a")), body="Text")
+    # Missing optional fields are fine.
+    assert (
+        converter.structure(
+            {"id": 2, "author": {"name": "Bob", "tag": None}},
+            Post,
+            projection={"id", "body", "author.name", "author.tag.name"},
+        )
+        == Post(2, author=Author("Bob"))
+    )
+
+
+def test_whole_field_wins():
+    converter = Converter()
+
+    assert converter.unstructure(
+        POST, projection={"author.name", "author"}
+    ) == {"author": converter.unstructure(POST.author)}
+
+
+def test_projection_errors():
+    converter = GenConverter()
+
+    with pytest.raises(ValueError, match="Required field Post.id"):
+        converter.structure({"title": "t"}, Post, projection={"title"})
+    with pytest.raises(ValueError, match="Required field Author.name"):
+        converter.structure({"id": 1}, Post, projection={"id", "author.email"})
+    with pytest.raises(ValueError, match="Unknown fields of Post: nope"):
+        converter.unstructure(POST, projection={"id", "nope"})
+    with pytest.raises(ValueError, match="Post.title"):
+        converter.unstructure(POST, projection={"title.length"})
+    with pytest.raises(ValueError, match="Only dataclasses"):
+        converter.unstructure(1, projection={"real"})
+
+
+def test_omit_if_default():
+    converter = GenConverter(omit_if_default=True)
+
+    assert converter.unstructure(
+        Post(1, author=Author("Ann")), projection={"title", "author.email"}
+    ) == {"author": {}}
+
+
+def test_projected_functions_cached():
+    converter = GenConverter()
+    converter.unstructure(POST, projection=["id", "title"])
+    fn = converter._projected_fn("unstructure", Post, {"title", "id"})
+
+    converter.unstructure(POST, projection=("title", "id"))
+    assert converter._projected_fn("unstructure", Post, {"id", "title"}) is fn
+
+    converter.register_unstructure_hook(str, lambda s: s.upper())
+    assert converter.unstructure(POST, projection={"title"}) == {
+        "title": "TITLE"
+    }
+    assert (
+        converter._projected_fn("unstructure", Post, {"id", "title"}) is not fn
+    )
+
+
+def test_projected_functions_bounded():
+    converter = GenConverter(dispatch_cache_size=2)
+    for name in ("id", "title", "body"):
+        converter.unstructure(POST, projection={name})
+
+    assert converter._projected_fns.cache_info().currsize == 2
+
+
+@dataclass
+class Circle:
+    radius: int
+    color: str = ""
+
+
+@dataclass
+class Square:
+    side: int
+    color: str = ""
+
+
+@dataclass
+class Drawing:
+    shape: Circle
+    other: Optional[Circle] = None
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_nested_hooks_win(converter_cls):
+    """Nested classes with hooks of their own are converted by them,
+    ignoring the nested projection."""
+    converter = converter_cls()
+    converter.register_tagged_union(Union[Circle, Square])
+    converter.register_structure_hook(
+        Optional[Circle], lambda o, _: Circle(o["radius"] + 1)
+    )
+    drawing = Drawing(Circle(1, "red"))
+
+    assert converter.unstructure(
+        drawing, projection={"shape.radius"}
+    ) == {"shape": {"radius": 1, "color": "red", "type": "Circle"}}
+    assert converter.structure(
+        {"shape": {"radius": 1}, "other": {"radius": 1}},
+        Drawing,
+        projection={"shape.radius", "other.radius"},
+    ) == Drawing(Circle(1), Circle(2))
+
+
+@dataclass
+class Money:
+    amount: int
+    currency: str = "USD"
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_root_hooks_refuse_projection(converter_cls):
+    converter = converter_cls()
+    converter.register_structure_hook(
+        Money, lambda o, _: Money(int(o[:-3]), o[-3:])
+    )
+    converter.register_unstructure_hook(
+        Money, lambda m: "{}{}".format(m.amount, m.currency)
+    )
+
+    with pytest.raises(ValueError, match="structure hook of its own"):
+        converter.structure("1USD", Money, projection={"amount"})
+    with pytest.raises(ValueError, match="unstructure hook of its own"):
+        converter.unstructure(Money(1), projection={"amount"})
@@ -1,11 +1,17 @@
 """Test structuring of collections and primitives."""
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from threading import Thread
 from typing import (
     Any,
     Dict,
     FrozenSet,
     List,
+    MutableSequence,
     MutableSet,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -29,7 +35,7 @@ from hypothesis.strategies import (
 )
 from pytest import raises
 
-from convclasses import Converter
+from convclasses import Converter, UnstructureStrategy
 from convclasses._compat import is_bare, is_union_type
 from convclasses.converters import NoneType
 
@@ -289,6 +295,65 @@ def test_structuring_primitive_union_hook(converter, ints):
             assert str(x) == y
 
 
+def test_union_hooks():
+    """Hooks for unions are built once per union, and rebuilt after union
+    hooks are registered."""
+    converter = Converter()
+    dispatch = converter._structure_func.dispatch
+    hook = dispatch(Optional[int])
+
+    assert dispatch(Optional[int]) is hook
+    assert converter.structure("1", Optional[int]) == 1
+    assert converter.structure(None, Optional[int]) is None
+    with raises(ValueError):
+        converter.structure(1.5, Union[int, str])
+
+    converter.register_structure_hook(Optional[int], lambda v, _: -v)
+    converter.register_structure_hook(Union[int, str], lambda v, _: v)
+
+    assert converter.structure(1, Optional[int]) == -1
+    assert converter.structure(None, Optional[int]) is None
+    assert converter.structure(1.5, Union[int, str]) == 1.5
+
+
+@given(one_of(integers(), text(), booleans(), floats(allow_nan=False)))
+def test_structuring_primitive_unions(converter, val):
+    """Values are structured into the member of their own type."""
+    res = converter.structure(val, Union[int, str, float])
+
+    assert res == val
+    assert res.__class__ is (int if val.__class__ is bool else val.__class__)
+
+
+def test_structuring_mixed_unions():
+    """Members are picked by the class of the data, then its shape."""
+
+    @dataclass
+    class Point:
+        x: int
+        y: int = 0
+
+    class Color(Enum):
+        RED = "red"
+
+    converter = Converter()
+    union = Union[Point, List[str], Dict[str, int], Color, float, None]
+
+    assert converter.structure({"x": "1"}, union) == Point(1)
+    assert converter.structure({"a": "1"}, union) == {"a": 1}
+    assert converter.structure(("a", 1), union) == ["a", "1"]
+    assert converter.structure("red", union) is Color.RED
+    assert converter.structure(1, union) == 1.0
+    assert converter.structure(None, union) is None
+    assert converter.structure([1], Union[int, Any]) == [1]
+    with raises(ValueError):
+        converter.structure(b"red", union)
+
+    converter = Converter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+    assert converter.structure([1, 2], Union[Point, int]) == Point(1, 2)
+    assert converter.structure(3, Union[Point, int]) == 3
+
+
 def test_structure_hook_func(converter):
     """ testing the hook_func method """
 
@@ -326,7 +391,8 @@ def test_structuring_unsupported(converter):
     with raises(ValueError):
         converter.structure(1, Converter)
     with raises(ValueError):
-        converter.structure(1, Union[int, str])
+        # No member of the union takes floats.
+        converter.structure(1.5, Union[int, str])
 
 
 def test_subclass_registration_is_honored(converter):
@@ -348,3 +414,149 @@ def test_subclass_registration_is_honored(converter):
     converter.register_structure_hook(Bar, lambda obj, cls: cls("bar"))
     assert converter.structure(None, Foo).value == "foo"
     assert converter.structure(None, Bar).value == "bar"
+
+
+def test_dispatch_cache_info():
+    converter = Converter(dispatch_cache_size=None)
+
+    converter.structure([1], List[int])
+    converter.structure([2], List[int])
+
+    info = converter.dispatch_cache_info()["structure"]
+    assert info.misses == 2
+    assert info.hits == 2
+    assert info.maxsize is None
+
+
+def test_dispatch_stats():
+    converter = Converter(collect_dispatch_stats=True)
+
+    converter.structure([1], List[int])
+    converter.structure([2], List[int])
+    converter.structure([3], Set[int])
+
+    hits = {
+        handler: hits
+        for _, handler, hits in converter.dispatch_stats()["structure"]
+    }
+    assert hits[converter._structure_list] == 1
+    assert hits[converter._structure_set] == 1
+    assert hits[converter._structure_dict] == 0
+    with raises(ValueError):
+        Converter().dispatch_stats()
+
+
+def test_registering_while_structuring():
+    """Hooks can be registered while other threads structure."""
+    converter = Converter()
+
+    class Foo(object):
+        def __init__(self, value):
+            self.value = value
+
+    errors = []
+
+    def work():
+        try:
+            for _ in range(2000):
+                assert converter.structure(["1"], List[int]) == [1]
+                assert converter.structure(1, Foo).value in (1, 2)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    converter.register_structure_hook(Foo, lambda obj, cls: cls(obj))
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(200):
+        converter.register_structure_hook(
+            Foo, lambda obj, cls, inc=i % 2: cls(obj + inc)
+        )
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert converter.structure(1, Foo).value == 2
+
+
+def test_structuring_primitive_collections():
+    """Collections of primitives and enums are converted in bulk."""
+    converter = Converter()
+
+    class Color(Enum):
+        RED = "red"
+
+    assert converter.structure(["1", 2.0], List[int]) == [1, 2]
+    assert converter.structure(("1", "2"), Tuple[float, ...]) == (1.0, 2.0)
+    assert converter.structure([1, 1], Set[str]) == {"1"}
+    assert converter.structure(["red"], FrozenSet[Color]) == {Color.RED}
+
+    converter.register_structure_hook(int, lambda v, _: int(v) * 2)
+    assert converter.structure(["1", "2"], List[int]) == [2, 4]
+
+
+def test_array_sequences():
+    converter = Converter(array_sequences=True)
+
+    res = converter.structure(["1", 2], Sequence[int])
+    assert res == array("q", [1, 2])
+    assert converter.structure([1, "2.5"], MutableSequence[float]) == array(
+        "d", [1.0, 2.5]
+    )
+    assert converter.structure(["1"], List[int]) == [1]
+    assert converter.structure(["1"], Sequence[str]) == ["1"]
+    assert Converter().structure(["1"], Sequence[int]) == [1]
+
+
+def test_array_sequences_big_ints():
+    """Ints too big for an array are kept in a list."""
+    converter = Converter(array_sequences=True)
+
+    assert converter.structure(iter([1, 2 ** 70]), Sequence[int]) == [
+        1,
+        2 ** 70,
+    ]
+
+
+def test_trust_input():
+    """Correctly typed input is reused as is."""
+    converter = Converter(trust_input=True)
+
+    class Color(Enum):
+        RED = "red"
+
+    ints = [1, 2]
+    nested = [ints, [3]]
+    mapping = {Color.RED: 1.5}
+    tup = ("a", "b")
+    assert converter.structure(ints, List[int]) is ints
+    assert converter.structure(ints, List) is ints
+    assert converter.structure(tup, Tuple[str, ...]) is tup
+    assert converter.structure(tup, Tuple) is tup
+    assert converter.structure(frozenset(tup), FrozenSet[str]) == set(tup)
+    # Other tests change the parameters of common dict and set types.
+    assert converter.structure(mapping, Dict[Color, float]) is mapping
+    assert converter.structure(mapping, Dict) is mapping
+    res = converter.structure(nested, List[List[int]])
+    assert res == nested and res is not nested and res[0] is ints
+    assert converter.structure(Color.RED, Color) is Color.RED
+
+    # Anything else is converted as usual.
+    assert converter.structure([1, "2"], List[int]) == [1, 2]
+    assert converter.structure([True], List[int]) == [1]
+    assert converter.structure((1,), List[str]) == ["1"]
+    assert converter.structure({"red": 1}, Dict[Color, str]) == {
+        Color.RED: "1"
+    }
+    assert converter.structure(tup, Tuple[str, str]) is not tup
+
+    # As are types with hooks of their own.
+    converter.register_structure_hook(int, lambda v, _: v + 1)
+    assert converter.structure(ints, List[int]) == [2, 3]
+
+
+def test_no_trust_input_copies():
+    converter = Converter()
+    ints = [1, 2]
+
+    assert converter.structure(ints, List[int]) is not ints
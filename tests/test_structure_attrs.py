@@ -1,5 +1,12 @@
 """Loading of attrs classes."""
-from dataclasses import MISSING, asdict, astuple, fields
+from dataclasses import (
+    MISSING,
+    asdict,
+    astuple,
+    dataclass,
+    fields,
+    make_dataclass,
+)
 from typing import Any, Union
 
 from hypothesis import assume, given
@@ -136,3 +143,32 @@ def test_structure_union_explicit(converter, cl_and_vals_a, cl_and_vals_b):
     assert inst == converter.structure(
         converter.unstructure(inst), Union[cl_a, cl_b]
     )
+
+
+def test_structure_hooks_registered_later_are_used(converter):
+    """Field plans are rebuilt when structure hooks change."""
+
+    @dataclass
+    class Inner:
+        a: int
+
+    @dataclass
+    class Outer:
+        inner: Inner
+
+    assert converter.structure({"inner": {"a": 1}}, Outer) == Outer(Inner(1))
+
+    converter.register_structure_hook(Inner, lambda o, _: Inner(o))
+
+    assert converter.structure({"inner": 2}, Outer) == Outer(Inner(2))
+
+
+def test_field_plans_bounded():
+    """Field plans are cached like hooks, in a bounded cache."""
+    converter = Converter(dispatch_cache_size=2)
+    classes = [make_dataclass("C{}".format(i), [("a", int)]) for i in range(5)]
+
+    for cl in classes:
+        assert converter.structure({"a": 1}, cl) == cl(1)
+
+    assert converter._field_plans.cache_info().currsize == 2
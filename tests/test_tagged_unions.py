@@ -0,0 +1,118 @@
+"""Tests for tagged unions."""
+import pickle
+from dataclasses import dataclass
+from typing import Generic, List, Optional, TypeVar, Union
+
+import pytest
+
+from convclasses import Converter, GenConverter, UnstructureStrategy
+from convclasses._compat import is_py37
+
+T = TypeVar("T")
+
+
+@dataclass
+class Click:
+    x: int
+    y: int
+
+
+@dataclass
+class Move:
+    x: int
+    y: int
+    kind: str = "move"
+
+
+@dataclass
+class Wrapped(Generic[T]):
+    x: T
+
+
+Event = Union[Click, Move]
+
+
+@dataclass
+class Log:
+    events: List[Event]
+    last: Optional[Event] = None
+
+
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_tagged_union(converter_cls):
+    """Classes with the same fields are told apart by their tags."""
+    converter = converter_cls()
+    converter.register_tagged_union(Event, "kind")
+    log = Log([Click(1, 2), Move(3, 4)], Click(5, 6))
+
+    raw = converter.unstructure(log)
+
+    assert raw == {
+        "events": [
+            {"x": 1, "y": 2, "kind": "Click"},
+            {"x": 3, "y": 4, "kind": "move"},
+        ],
+        "last": {"x": 5, "y": 6, "kind": "Click"},
+    }
+    assert converter.structure(raw, Log) == log
+    assert converter.structure({**raw, "last": None}, Log).last is None
+    assert pickle.loads(pickle.dumps(converter)).structure(raw, Log) == log
+
+
+def test_tag_table():
+    converter = GenConverter()
+    converter.register_tagged_union(
+        Union[Click, Wrapped[int]], tags={Click: 1, Wrapped[int]: 2}
+    )
+
+    assert converter.unstructure(Wrapped(3)) == {"x": 3, "type": 2}
+    assert converter.structure(
+        {"x": "3", "type": 2}, Union[Click, Wrapped[int]]
+    ) == Wrapped(3)
+
+
+def test_errors():
+    converter = Converter()
+    converter.register_tagged_union(Event)
+
+    with pytest.raises(ValueError, match="Unknown tag: 'Jump'"):
+        converter.structure({"x": 1, "y": 1, "type": "Jump"}, Event)
+    with pytest.raises(ValueError, match="Missing tag"):
+        converter.structure({"x": 1, "y": 1}, Event)
+    with pytest.raises(ValueError):
+        converter.register_tagged_union(Union[Click, int])
+    with pytest.raises(ValueError):
+        converter.register_tagged_union(Event, tags={Click: "c", Move: "c"})
+    with pytest.raises(ValueError):
+        Converter(
+            unstruct_strat=UnstructureStrategy.AS_TUPLE
+        ).register_tagged_union(Event)
+
+
+@pytest.mark.skipif(is_py37, reason="Literal is new in Python 3.8.")
+@pytest.mark.parametrize("converter_cls", [Converter, GenConverter])
+def test_literal_tags(converter_cls):
+    from typing import Literal
+
+    @dataclass
+    class Open:
+        path: str
+        type: Literal["open"]
+
+    @dataclass
+    class Close:
+        path: str
+        type: Literal["close"] = "close"
+
+    converter = converter_cls()
+    converter.register_tagged_union(Union[Open, Close])
+
+    assert converter.unstructure(Open("a", "open")) == {
+        "path": "a",
+        "type": "open",
+    }
+    assert converter.structure(
+        {"path": "a", "type": "close"}, Union[Open, Close]
+    ) == Close("a")
+    with pytest.raises(ValueError):
+        converter.structure({"path": "a", "type": "close"}, Open)
@@ -1,5 +1,5 @@
 """Tests for dumping."""
-from dataclasses import asdict, astuple
+from dataclasses import asdict, astuple, dataclass
 from typing import Any, Type
 
 from hypothesis import given
@@ -126,3 +126,71 @@ def test_unstructure_hook_func(converter):
     b = Bar()
     assert converter.unstructure(Foo()) == "hi"
     assert converter.unstructure(b) is b
+
+
+def test_unstructure_hooks_replace_cached_ones(converter):
+    """Hooks registered after a class was unstructured are used."""
+    assert converter.unstructure(1) == 1
+
+    converter.register_unstructure_hook(int, str)
+
+    assert converter.unstructure(1) == "1"
+    assert converter.unstructure([1]) == ["1"]
+
+
+def test_unstructure_resolves_no_structure_hooks():
+    """Unstructuring dataclasses doesn't produce structuring hooks."""
+
+    @dataclass
+    class Money:
+        amount: int
+
+    @dataclass
+    class Order:
+        total: Money
+
+    calls = []
+
+    def factory(cl):
+        calls.append(cl)
+        return lambda o, _: Money(o)
+
+    for strat in UnstructureStrategy:
+        converter = Converter(unstruct_strat=strat)
+        converter.register_structure_hook_factory(
+            lambda cl: cl is Money, factory
+        )
+
+        converter.unstructure(Order(Money(1)))
+        converter.unstructure_columns([Order(Money(1))], Order)
+
+    assert calls == []
+
+
+def test_dispatch_cache_info():
+    converter = Converter(dispatch_cache_size=None)
+
+    converter.unstructure([1, "a"])
+    converter.unstructure([2, "b"])
+
+    info = converter.dispatch_cache_info()["unstructure"]
+    assert info.misses == 3
+    assert info.hits == 3
+    assert info.maxsize is None
+
+
+def test_dispatch_cache_info_bounded():
+    """The exact-class table is bounded and its hits are counted."""
+    converter = Converter(dispatch_cache_size=2)
+    classes = [type("C{}".format(i), (), {}) for i in range(10)]
+
+    for _ in range(3):
+        for cl in classes:
+            converter.unstructure(cl())
+
+    info = converter.dispatch_cache_info()["unstructure"]
+    assert len(converter._unstructure_func._direct_dispatch) == 2
+    assert info.hits == 4
+    assert info.misses == 26
+    assert info.evictions == 24
+    assert info.currsize == 2